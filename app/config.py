@@ -5,11 +5,18 @@ load_dotenv()
 
 class Config:
     FIREFLIES_API_KEY = os.getenv("FIREFLIES_API_KEY")
+    FIREFLIES_WEBHOOK_SECRET = os.getenv("FIREFLIES_WEBHOOK_SECRET")
     MONGODB_URI = os.getenv("MONGODB_URI")
     SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
     SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
     SLACK_SIGNING_SECRET = os.getenv("SLACK_SIGNING_SECRET")
     
+    # Optional: shared Redis for cross-worker deduplication
+    REDIS_URL = os.getenv("REDIS_URL")
+    
+    # Optional: bearer token for /meetings/{id}/stream (the endpoint is disabled without it)
+    STREAM_API_TOKEN = os.getenv("STREAM_API_TOKEN")
+    
     # LLM Keys
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     
@@ -1,7 +1,6 @@
-from motor.motor_asyncio import AsyncIOMotorClient
 from langgraph.checkpoint.base import BaseCheckpointSaver, CheckpointTuple
 from typing import Optional, Dict, Any, AsyncIterator, Sequence
-from app.config import settings
+from app.services.storage import db
 import logging
 import json
 from pydantic import BaseModel
@@ -43,8 +42,9 @@ class MongoDBCheckpointSaver(BaseCheckpointSaver):
     """
     
     def __init__(self):
-        self.client = AsyncIOMotorClient(settings.MONGODB_URI)
-        self.db = self.client.get_database("cube_intelligence")
+        # Reuse the storage client so checkpoints share one tuned connection pool
+        self.client = db.client
+        self.db = db.db
         self.checkpoints = self.db.get_collection("checkpoints")
         logger.info("✅ MongoDB Checkpoint Saver initialized")
     
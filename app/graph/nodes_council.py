@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from app.config import settings
@@ -12,6 +12,7 @@ from app.state import (
 )
 from pydantic import BaseModel
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -26,28 +27,55 @@ llm = ChatGoogleGenerativeAI(
 # COUNCIL AGENTS (New Non-Linear Architecture)
 # ============================================================
 
+REFINER_MAX_COMMITMENTS = 25  # Above this, the refiner only sees commitments relevant to the feedback
+_UNASSIGNED_OWNERS = {"tbd"}  # Placeholder owners that never count as "named" in feedback
 
-def format_transcript(transcript: List) -> str:
-    """Helper to format transcript with line numbers"""
-    return "\n".join([f"[{i}] {s.speaker}: {s.text}" for i, s in enumerate(transcript)])
-
-def get_effective_participants(state: MeetingState) -> List[str]:
+def format_commitments(commitments: List[Commitment], instructions: str = None) -> str:
     """
-    Returns participants list. Merges unique speakers from the transcript 
-    with any metadata participants to ensure full coverage.
+    Compact numbered listing of commitments for prompts.
+    For long lists, keeps only items whose owner is named in `instructions`
+    (as a whole word, case-insensitively; "TBD" owners never match) and notes
+    how many were left out.
     """
-    participants = set()
+    selected = list(enumerate(commitments, 1))
+    if instructions and len(commitments) > REFINER_MAX_COMMITMENTS:
+        named = {
+            owner for owner in {(c.owner or "").strip() for c in commitments}
+            if owner and owner.lower() not in _UNASSIGNED_OWNERS
+            and re.search(rf"(?<!\w){re.escape(owner)}(?!\w)", instructions, re.IGNORECASE)
+        }
+        relevant = [(i, c) for i, c in selected if c.owner and c.owner.strip() in named]
+        if relevant:
+            selected = relevant
     
-    # 1. Add metadata participants if available
-    if state.metadata.participants:
-        participants.update(state.metadata.participants)
-        
-    # 2. Add actual speakers from transcript (CRITICAL: Always do this)
-    for segment in state.transcript:
-        if segment.speaker and segment.speaker.strip():
-            participants.add(segment.speaker.strip())
-            
-    return list(participants) if participants else ["Unknown Participants"]
+    lines = [f"{i}. owner={c.owner} task={c.task} due={c.due}" for i, c in selected]
+    omitted = len(commitments) - len(selected)
+    if omitted:
+        lines.append(f"({omitted} other action items omitted - keep them unchanged)")
+    return "\n".join(lines) if lines else "None"
+
+def prepare_transcript(state: MeetingState) -> Tuple[str, List[str]]:
+    """
+    Single pass over the transcript producing the line-numbered transcript text and the
+    participants list, for agents whose prompts need both.
+    Participants merge any metadata participants with the unique transcript speakers,
+    to ensure full coverage. Order is deterministic (metadata first, then speakers by
+    first appearance), so prompts built from it are stable across runs.
+    """
+    lines = []
+    # dict.fromkeys = insertion-ordered de-duplication
+    participants = dict.fromkeys(state.metadata.participants or ())
+    for i, segment in enumerate(state.transcript):
+        lines.append(f"[{i}] {segment.speaker}: {segment.text}")
+        # Add actual speakers from transcript (CRITICAL: Always do this)
+        name = segment.speaker.strip() if segment.speaker else ""
+        if name:
+            participants[name] = None
+    return "\n".join(lines), (list(participants) if participants else ["Unknown Participants"])
+
+def get_effective_participants(state: MeetingState) -> List[str]:
+    """Returns the participants list from prepare_transcript(), for prompts that don't need the transcript."""
+    return prepare_transcript(state)[1]
 
 
 
@@ -65,7 +93,7 @@ async def agent_strategist(state: MeetingState) -> Dict[str, Any]:
     logger.info(f"   Meeting ID: {state.meeting_id}")
     logger.info(f"   Transcript segments: {len(state.transcript)}")
     
-    transcript_text = format_transcript(state.transcript)
+    transcript_text, participants = prepare_transcript(state)
     
     prompt = f"""
 You are a meeting context analyst. Analyze this meeting and determine:
@@ -90,7 +118,7 @@ Metadata:
 - Date: {state.metadata.date}
 - Title: {state.metadata.title}
 - Date: {state.metadata.date}
-- Participants: {', '.join(get_effective_participants(state))}
+- Participants: {', '.join(participants)}
 
 Transcript (with line numbers):
 {transcript_text[:50000]}
@@ -134,10 +162,10 @@ async def agent_extractor(state: MeetingState) -> Dict[str, Any]:
     logger.info(f"   Meeting ID: {state.meeting_id}")
     logger.info(f"   Processing {len(state.transcript)} transcript segments")
     
-    transcript_text = format_transcript(state.transcript)
+    transcript_text, participants = prepare_transcript(state)
     logger.info(f"   Formatted transcript length: {len(transcript_text)} chars")
     
-    participants_list = ", ".join(get_effective_participants(state))
+    participants_list = ", ".join(participants)
 
     prompt = f"""
 You are a PRECISE data extractor. Extract structured action items from this transcript.
@@ -248,7 +276,7 @@ async def agent_critic(state: MeetingState) -> Dict[str, Any]:
     logger.info(f"     • Decisions: {len(state.extractor.decisions)}")
     logger.info(f"     • Metrics: {len(state.extractor.metrics)}")
     
-    transcript_text = format_transcript(state.transcript)
+    transcript_text, participants = prepare_transcript(state)
     
     prompt = f"""
 You are The Critic - a validation agent that checks for consistency and accuracy.
@@ -266,7 +294,7 @@ You are The Critic - a validation agent that checks for consistency and accuracy
 - Decisions: {state.extractor.decisions}
 
 **PARTICIPANT LIST (Hint only)**:
-{', '.join(get_effective_participants(state))}
+{', '.join(participants)}
 
 **YOUR VALIDATION TASKS**:
 
@@ -316,12 +344,12 @@ Be strict but fair. If uncertain, REJECT and ask for retry.
         if not response.strategist_approved:
             logger.warning("⚠️ STRATEGIST REJECTED")
             logger.warning(f"   Reason: {response.strategist_feedback}")
-            logger.warning(f"   Current retry count: {state.retry_counts.get('strategist', 0)}")
+            logger.warning(f"   Current retry count: {state.retry_counts.strategist}")
         
         if not response.extractor_approved:
             logger.warning("⚠️ EXTRACTOR REJECTED")
             logger.warning(f"   Reason: {response.extractor_feedback}")
-            logger.warning(f"   Current retry count: {state.retry_counts.get('extractor', 0)}")
+            logger.warning(f"   Current retry count: {state.retry_counts.extractor}")
         
         if response.strategist_approved and response.extractor_approved:
             logger.info("🎉 Both agents APPROVED! Proceeding to Copywriter.")
@@ -549,8 +577,9 @@ Body:
 {state.human_feedback.instructions}
 
 **VERIFIED FACTS** (DO NOT change these unless explicitly requested):
-- Action Items: {[{"owner": c.owner, "task": c.task, "due": c.due} for c in state.extractor.commitments]}
-- Decisions: {state.extractor.decisions}
+Action Items:
+{format_commitments(state.extractor.commitments, state.human_feedback.instructions)}
+Decisions: {state.extractor.decisions}
 
 **INSTRUCTIONS**:
 1. Determine if the feedback applies to the CLIENT EMAIL, INTERNAL PLAN, or BOTH
@@ -1,6 +1,6 @@
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
-from typing import Literal
+from typing import Literal, AsyncIterator, Dict, Any, Set
 from datetime import datetime, timezone
 from app.state import MeetingState
 from app.graph.nodes_council import (
@@ -10,7 +10,9 @@ from app.graph.nodes_council import (
     agent_copywriter,
     agent_refiner
 )
+import asyncio
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +67,8 @@ def route_after_critic(state: MeetingState) -> Literal["strategist", "extractor"
     """
     logger.info("🔀 ROUTING: Determining next step after Critic...")
     
-    strategist_retries = state.retry_counts.get("strategist", 0)
-    extractor_retries = state.retry_counts.get("extractor", 0)
+    strategist_retries = state.retry_counts.strategist
+    extractor_retries = state.retry_counts.extractor
     
     logger.info(f"   Retry counts: Strategist={strategist_retries}, Extractor={extractor_retries}")
     logger.info(f"   Strategist approved: {state.critic.strategist_approved}")
@@ -134,6 +136,16 @@ workflow.add_conditional_edges(
 workflow.add_edge("copywriter", "human_review")
 
 
+# (status, has_instructions) -> next step; anything missing stays paused (END)
+# "pending" and "active_review" both mean the meeting is awaiting/receiving human input
+_HUMAN_ROUTES = {
+    ("pending", True): "refiner",
+    ("active_review", True): "refiner",
+    ("approved", False): "finalize",
+    ("approved", True): "finalize",
+}
+
+
 def route_after_human(state: MeetingState) -> str:
     """
     Routes after human review checkpoint.
@@ -141,31 +153,29 @@ def route_after_human(state: MeetingState) -> str:
     - If user approves (status = "approved") → finalize and end
     - Otherwise → stay paused (pending)
     """
-    logger.info("🔀 ROUTING: Determining next step after Human Review...")
-    
-    feedback_status = state.human_feedback.status
-    has_instructions = state.human_feedback.instructions and len(state.human_feedback.instructions.strip()) > 0
+    feedback = state.human_feedback
+    status = feedback.status
+    instructions = feedback.instructions
+    has_instructions = bool(instructions and instructions.strip())
     
-    logger.info(f"   Human feedback status: {feedback_status}")
-    logger.info(f"   Has instructions: {has_instructions}")
+    route = _HUMAN_ROUTES.get((status, has_instructions), END)
     
-    # Check if user provided feedback (status can be "pending" or "active_review")
-    # Both indicate the meeting is awaiting/receiving human input
-    if feedback_status in ("pending", "active_review") and has_instructions:
-        logger.info("🔄 ROUTING: User provided feedback")
-        logger.info(f"   Instructions: {state.human_feedback.instructions[:100] if state.human_feedback.instructions else 'None'}...")
-        logger.info("   Next step: Refiner (apply feedback)")
-        return "refiner"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("🔀 ROUTING: Determining next step after Human Review...")
+        logger.info(f"   Human feedback status: {status}")
+        logger.info(f"   Has instructions: {has_instructions}")
+        if route == "refiner":
+            logger.info("🔄 ROUTING: User provided feedback")
+            logger.info(f"   Instructions: {instructions[:100]}...")
+            logger.info("   Next step: Refiner (apply feedback)")
+        elif route == "finalize":
+            logger.info("✅ ROUTING: Human approved the draft")
+            logger.info("   Next step: Finalize and END")
+        else:
+            logger.info("⏸️ ROUTING: Still waiting for human feedback")
+            logger.info("   Next step: Stay at human_review (paused)")
     
-    if feedback_status == "approved":
-        logger.info("✅ ROUTING: Human approved the draft")
-        logger.info("   Next step: Finalize and END")
-        return "finalize"
-    
-    # Default: still pending (waiting for user input)
-    logger.info("⏸️ ROUTING: Still waiting for human feedback")
-    logger.info("   Next step: Stay at human_review (paused)")
-    return END
+    return route
 
 
 workflow.add_conditional_edges(
@@ -194,6 +204,7 @@ workflow.add_edge("refiner", "human_review")
 # Use persistent MongoDB checkpointer for cross-request resume
 # This allows the pipeline to survive between web requests (e.g. Slack events)
 from app.graph.checkpoint_saver import MongoDBCheckpointSaver
+from app.services.storage import db
 checkpointer = MongoDBCheckpointSaver()
 
 app_graph = workflow.compile(
@@ -206,16 +217,69 @@ app_graph = workflow.compile(
 # EXECUTION FUNCTION
 # ============================================================
 
-async def run_council_pipeline(initial_state: MeetingState, thread_id: str = None) -> MeetingState:
+# Per-thread progress listeners (e.g. SSE clients watching a running pipeline).
+# With Redis configured, pipelines run on the ARQ worker, so progress is relayed over
+# pub/sub on PROGRESS_CHANNEL instead; these in-process queues are the no-Redis fallback.
+_progress_listeners: Dict[str, Set[asyncio.Queue]] = {}
+
+PROGRESS_CHANNEL = "cube:progress:{}"
+
+
+def subscribe_progress(thread_id: str) -> asyncio.Queue:
+    """Registers a queue that receives a summary of every progress event for `thread_id`."""
+    queue = asyncio.Queue()
+    _progress_listeners.setdefault(thread_id, set()).add(queue)
+    return queue
+
+
+def unsubscribe_progress(thread_id: str, queue: asyncio.Queue):
+    listeners = _progress_listeners.get(thread_id)
+    if listeners is not None:
+        listeners.discard(queue)
+        if not listeners:
+            del _progress_listeners[thread_id]
+
+
+def progress_summary(event: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Executes the Council intelligence pipeline.
+    What progress listeners see: step names and status only. Node outputs (email draft,
+    internal action plan, commitments) never leave the pipeline through this channel.
+    """
+    if event["type"] == "node":
+        return {"type": "node", "name": event["name"]}
+    if event["type"] == "completed":
+        return {"type": "completed", "status": event["state"].human_feedback.status}
+    return {"type": event["type"]}
+
+
+async def _publish_progress(thread_id: str, event: Dict[str, Any]):
+    if db.redis is not None:
+        try:
+            await db.redis.publish(PROGRESS_CHANNEL.format(thread_id), orjson.dumps(progress_summary(event)))
+        except Exception as e:
+            # Progress is best-effort; never fail the pipeline over it
+            logger.warning(f"⚠️ Progress publish failed for {thread_id}: {e}")
+        return
+
+    listeners = _progress_listeners.get(thread_id)
+    if not listeners:
+        return
+    summary = progress_summary(event)
+    for queue in listeners:
+        queue.put_nowait(summary)
+
+
+async def stream_council_pipeline(initial_state: MeetingState, thread_id: str = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Executes the Council pipeline, yielding a progress event per graph step.
     
-    Args:
-        initial_state: Initial meeting state with transcript
-        thread_id: Unique thread ID for checkpointing (defaults to meeting_id)
+    Events:
+        {"type": "node", "name": <node>, "delta": <node output>}
+        {"type": "interrupt"}                     (paused at human_review)
+        {"type": "completed", "state": <MeetingState>}
     
-    Returns:
-        Final enriched state (or partial state if interrupted)
+    A summary of every event (see progress_summary) is also published: to Redis
+    PROGRESS_CHANNEL when configured, otherwise to listeners registered via subscribe_progress().
     """
     if not thread_id:
         thread_id = initial_state.meeting_id
@@ -233,23 +297,28 @@ async def run_council_pipeline(initial_state: MeetingState, thread_id: str = Non
     final_state = initial_state  # Start with initial state
     async for event in app_graph.astream(initial_state, config):
         # event is a dict like {"strategist": {...}, "critic": {...}}
-        if event:
-            event_nodes = list(event.keys())
-            logger.info(f"📊 PIPELINE EVENT: {', '.join(event_nodes)}")
-            
-            # Update final_state with each event's state updates
-            for node_name, node_output in event.items():
-                if node_name != "__interrupt__":
-                    # Merge the node output into final state
-                    if isinstance(node_output, dict):
-                        for key, value in node_output.items():
-                            if hasattr(final_state, key):
-                                setattr(final_state, key, value)
-            
-            # Log checkpoint status
-            if "__interrupt__" in event_nodes:
+        if not event:
+            continue
+        
+        event_nodes = list(event.keys())
+        logger.info(f"📊 PIPELINE EVENT: {', '.join(event_nodes)}")
+        
+        for node_name, node_output in event.items():
+            if node_name == "__interrupt__":
+                # Log checkpoint status
                 logger.info("⏸️ CHECKPOINT: Pipeline paused at human_review")
                 logger.info(f"   State saved for thread: {thread_id}")
+                progress = {"type": "interrupt"}
+            else:
+                # Merge the node output into final state
+                if isinstance(node_output, dict):
+                    for key, value in node_output.items():
+                        if hasattr(final_state, key):
+                            setattr(final_state, key, value)
+                progress = {"type": "node", "name": node_name, "delta": node_output}
+            
+            await _publish_progress(thread_id, progress)
+            yield progress
     
     logger.info("="*80)
     if final_state.human_feedback.status == "pending":
@@ -258,9 +327,42 @@ async def run_council_pipeline(initial_state: MeetingState, thread_id: str = Non
     else:
         logger.info("✅ COUNCIL PIPELINE: COMPLETED")
     logger.info("="*80)
+    
+    completed = {"type": "completed", "state": final_state}
+    await _publish_progress(thread_id, completed)
+    yield completed
+
+
+async def run_council_pipeline(initial_state: MeetingState, thread_id: str = None) -> MeetingState:
+    """
+    Executes the Council intelligence pipeline.
+    
+    Args:
+        initial_state: Initial meeting state with transcript
+        thread_id: Unique thread ID for checkpointing (defaults to meeting_id)
+    
+    Returns:
+        Final enriched state (or partial state if interrupted)
+    """
+    final_state = initial_state
+    async for event in stream_council_pipeline(initial_state, thread_id):
+        if event["type"] == "completed":
+            final_state = event["state"]
     return final_state
 
 
+# Fields loaded from MongoDB when resuming (everything except the transcript & council internals)
+RESUME_FIELDS = [
+    "metadata",
+    "intent_context",
+    "topics",
+    "commitments",
+    "extractor",
+    "email",
+    "human_feedback",
+]
+
+
 async def resume_council_pipeline(thread_id: str, user_feedback: str, slack_user_id: str = None):
     """
     Resume a paused pipeline from the human_review checkpoint.
@@ -279,7 +381,9 @@ async def resume_council_pipeline(thread_id: str, user_feedback: str, slack_user
         
         # Load the current state from MongoDB
         from app.services.storage import db
-        current_state = await db.get_meeting(thread_id)
+        # Skip the transcript: the graph resumes from its checkpoint, and callers
+        # only need the draft, feedback and Slack summary fields
+        current_state = await db.get_meeting(thread_id, fields=RESUME_FIELDS)
         
         if not current_state:
             logger.error(f"❌ No meeting found for thread_id: {thread_id}")
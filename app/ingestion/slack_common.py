@@ -0,0 +1,110 @@
+"""
+Shared Slack helpers for the ingestion routers.
+
+One signature check and one pooled HTTP/2 client for every outbound Slack call,
+so replies reuse warm connections instead of paying a TCP+TLS handshake each time.
+"""
+
+from fastapi import Request, HTTPException
+from typing import Optional, Dict, Any
+import logging
+import hmac
+import time
+import httpx
+import orjson
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SIGNING_KEY = settings.SLACK_SIGNING_SECRET.encode() if settings.SLACK_SIGNING_SECRET else None
+
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=5,
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+)
+
+
+async def close_client():
+    """Closes the shared HTTP client (called on app shutdown)."""
+    await _client.aclose()
+
+
+async def verify_slack_signature(request: Request, body: bytes):
+    """
+    Verifies the X-Slack-Signature header using the signing secret.
+    """
+    if not settings.SLACK_SIGNING_SECRET:
+        logger.warning("⚠️ SLACK_SIGNING_SECRET not set. Skipping verification (UNSAFE).")
+        return
+
+    timestamp = request.headers.get("X-Slack-Request-Timestamp")
+    signature = request.headers.get("X-Slack-Signature")
+
+    if not timestamp or not signature:
+        raise HTTPException(status_code=400, detail="Missing Slack headers")
+
+    # Prevent replay attacks (5 minutes)
+    if abs(time.time() - int(timestamp)) > 60 * 5:
+        raise HTTPException(status_code=400, detail="Request too old")
+
+    # HMAC works on bytes: build the basestring without decoding/re-encoding the body
+    sig_basestring = b"v0:" + timestamp.encode("ascii") + b":" + body
+    my_signature = "v0=" + hmac.digest(_SIGNING_KEY, sig_basestring, "sha256").hex()
+
+    if not hmac.compare_digest(my_signature, signature):
+        raise HTTPException(status_code=403, detail="Invalid signature")
+
+
+async def slack_post(url: str, json: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """
+    POSTs a JSON payload to Slack over the shared keep-alive client.
+    Raises for non-2xx responses.
+    """
+    res = await _client.post(url, json=json, headers=headers)
+    res.raise_for_status()
+    return res
+
+
+async def reply_to_slack(channel: str, user_id: str, text: str):
+    """
+    Sends a message back to Slack using the Web API.
+    """
+    if not settings.SLACK_BOT_TOKEN:
+        logger.error("❌ SLACK_BOT_TOKEN not set. Cannot reply.")
+        return
+
+    url = "https://slack.com/api/chat.postMessage"
+    headers = {
+        "Authorization": f"Bearer {settings.SLACK_BOT_TOKEN}",
+        "Content-Type": "application/json"
+    }
+    # Ephemeral or visible? User didn't specify, defaulting to visible reply.
+    payload = {
+        "channel": channel,
+        "text": text,
+        # "user": user_id # If we wanted ephemeral
+    }
+    
+    try:
+        res = await slack_post(url, payload, headers=headers)
+        data = orjson.loads(res.content)
+        if not data.get("ok"):
+             logger.error(f"❌ Slack API Error: {data.get('error')}")
+    except Exception as e:
+        logger.error(f"❌ Failed to reply to Slack: {e}")
+
+
+async def send_response_to_slack(response_url: str, text: str):
+    """
+    Sends a response back to Slack using the response_url.
+    """
+    try:
+        payload = {
+            "response_type": "in_channel",
+            "replace_original": False,
+            "text": text
+        }
+        await slack_post(response_url, payload)
+    except Exception as e:
+        logger.error(f"❌ Failed to send response to Slack: {e}")
@@ -2,13 +2,8 @@ from fastapi import APIRouter, Request, BackgroundTasks, HTTPException, Header
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 import logging
-import hmac
-import hashlib
-import time
-import os
-import requests
-from app.config import settings
 from app.services.storage import db
+from app.ingestion.slack_common import verify_slack_signature, reply_to_slack
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -31,63 +26,6 @@ class SlackPayload(BaseModel):
     event_id: Optional[str] = None
     event_time: Optional[int] = None
 
-async def verify_slack_signature(request: Request, body: bytes):
-    """
-    Verifies the X-Slack-Signature header using the signing secret.
-    """
-    if not settings.SLACK_SIGNING_SECRET:
-        logger.warning("⚠️ SLACK_SIGNING_SECRET not set. Skipping verification (UNSAFE).")
-        return
-
-    timestamp = request.headers.get("X-Slack-Request-Timestamp")
-    signature = request.headers.get("X-Slack-Signature")
-
-    if not timestamp or not signature:
-        raise HTTPException(status_code=400, detail="Missing Slack headers")
-
-    # Prevent replay attacks (5 minutes)
-    if abs(time.time() - int(timestamp)) > 60 * 5:
-        raise HTTPException(status_code=400, detail="Request too old")
-
-    sig_basestring = f"v0:{timestamp}:{body.decode('utf-8')}"
-    my_signature = "v0=" + hmac.new(
-        settings.SLACK_SIGNING_SECRET.encode(),
-        sig_basestring.encode(),
-        hashlib.sha256
-    ).hexdigest()
-
-    if not hmac.compare_digest(my_signature, signature):
-        raise HTTPException(status_code=403, detail="Invalid signature")
-
-def reply_to_slack(channel: str, user_id: str, text: str):
-    """
-    Sends a message back to Slack using the Web API.
-    """
-    if not settings.SLACK_BOT_TOKEN:
-        logger.error("❌ SLACK_BOT_TOKEN not set. Cannot reply.")
-        return
-
-    url = "https://slack.com/api/chat.postMessage"
-    headers = {
-        "Authorization": f"Bearer {settings.SLACK_BOT_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    # Ephemeral or visible? User didn't specify, defaulting to visible reply.
-    payload = {
-        "channel": channel,
-        "text": text,
-        # "user": user_id # If we wanted ephemeral
-    }
-    
-    try:
-        res = requests.post(url, headers=headers, json=payload, timeout=5)
-        res.raise_for_status()
-        data = res.json()
-        if not data.get("ok"):
-             logger.error(f"❌ Slack API Error: {data.get('error')}")
-    except Exception as e:
-        logger.error(f"❌ Failed to reply to Slack: {e}")
-
 from app.services.slack import slack_service
 
 async def process_refinement_event(event: SlackEvent):
@@ -104,13 +42,14 @@ async def process_refinement_event(event: SlackEvent):
             
         logger.info(f"📨 Processing Human Feedback: '{event.text}' from {event.user}")
 
-        # 2. Find the PAUSED Meeting (human_feedback.status = "pending")
-        # This ensures we resume the correct pipeline, not just any meeting
-        meeting_state = await db.get_pending_meeting()
+        # 2. Find (and atomically claim) the PAUSED Meeting
+        # This ensures we resume the correct pipeline, not just any meeting.
+        # Only the title is needed here; resume loads the fields it uses itself.
+        meeting_state = await db.claim_pending_meeting(fields=["metadata"])
         
         if not meeting_state:
             logger.warning(f"⚠️ process_refinement_event: No pending meeting found for user {event.user}")
-            reply_to_slack(event.channel, event.user, "I couldn't find any meetings waiting for review. 🤷")
+            await reply_to_slack(event.channel, event.user, "I couldn't find any meetings waiting for review. 🤷")
             return
 
         logger.info(f"🔍 Found paused meeting: {meeting_state.meeting_id}")
@@ -125,8 +64,8 @@ async def process_refinement_event(event: SlackEvent):
             "related_meeting_id": meeting_state.meeting_id,
             "processed": False
         }
-        await db.save_refinement_request(doc)
-        logger.info(f"💾 Saved refinement request to DB")
+        db.save_refinement_request(doc)
+        logger.info(f"💾 Queued refinement request for DB")
 
         # 4. Determine Intent
         # Simple heuristic: Check if user approved or requested changes
@@ -135,11 +74,12 @@ async def process_refinement_event(event: SlackEvent):
         if any(word in user_text_lower for word in ["approve", "approved", "looks good", "perfect", "send it"]):
             # User approved - finalize
             logger.info("✅ User approved the draft")
-            meeting_state.human_feedback.status = "approved"
-            meeting_state.human_feedback.slack_user_id = event.user
-            await db.save_meeting(meeting_state)
+            await db.patch_meeting(meeting_state.meeting_id, {
+                "human_feedback.status": "approved",
+                "human_feedback.slack_user_id": event.user
+            })
             
-            reply_to_slack(event.channel, event.user, "✅ Draft approved! Finalizing...")
+            await reply_to_slack(event.channel, event.user, "✅ Draft approved! Finalizing...")
             # In production, this would trigger email sending or final export
             return
         
@@ -159,29 +99,33 @@ async def process_refinement_event(event: SlackEvent):
             )
         except Exception as e_resume:
              logger.error(f"❌ Resume failed with error: {e_resume}", exc_info=True)
-             reply_to_slack(event.channel, event.user, "❌ Error during pipeline resume. Check server logs.")
+             await reply_to_slack(event.channel, event.user, "❌ Error during pipeline resume. Check server logs.")
              return
         
         if not updated_state:
             logger.error("❌ Resume returned None (updated_state is None)")
-            reply_to_slack(event.channel, event.user, "❌ Failed to resume pipeline. Please try again.")
+            await reply_to_slack(event.channel, event.user, "❌ Failed to resume pipeline. Please try again.")
             return
         
         # 6. Save updated state to MongoDB with active_review status
         # CRITICAL: Mark as active_review so follow-up feedback targets THIS meeting
+        # Only the refined email and feedback changed - patch them, not the whole document
         updated_state.human_feedback.status = "active_review"
-        await db.save_meeting(updated_state)
+        await db.patch_meeting(updated_state.meeting_id, {
+            "email": updated_state.email.model_dump(),
+            "human_feedback": updated_state.human_feedback.model_dump()
+        })
         logger.info(f"💾 Saved updated state to MongoDB (status=active_review)")
         
         # 7. Send Updated Draft to Slack
         logger.info(f"📢 Sending updated draft to Slack")
-        slack_service.send_notification(updated_state, channel_id=event.channel)
+        await slack_service.send_notification(updated_state, channel_id=event.channel)
         
-        reply_to_slack(event.channel, event.user, "✅ Updated draft based on your feedback! Check above ⬆️")
+        await reply_to_slack(event.channel, event.user, "✅ Updated draft based on your feedback! Check above ⬆️")
 
     except Exception as e:
         logger.error(f"❌ Error processing slack event: {e}")
-        reply_to_slack(event.channel, event.user, "Sorry, I encountered an error while updating the draft. 😔")
+        await reply_to_slack(event.channel, event.user, "Sorry, I encountered an error while updating the draft. 😔")
 
 @router.post("/slack/events")
 async def slack_events(request: Request, background_tasks: BackgroundTasks):
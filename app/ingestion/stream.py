@@ -0,0 +1,84 @@
+"""
+Pipeline Progress Stream
+
+Server-Sent Events endpoint that relays Council pipeline progress as it happens.
+With Redis configured the pipeline runs on the ARQ worker, so events arrive over
+Redis pub/sub; without Redis they come from the in-process listener registry.
+Only step names and the final status are sent (see progress_summary); requires
+STREAM_API_TOKEN, passed as a Bearer token or `?token=` (browser EventSource can't set headers).
+"""
+
+from typing import Optional, AsyncIterator, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sse_starlette.sse import EventSourceResponse
+import hmac
+import json
+import logging
+import orjson
+from app.config import settings
+from app.graph.workflow_council import subscribe_progress, unsubscribe_progress, PROGRESS_CHANNEL
+from app.services.storage import db
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+_STREAM_TOKEN = settings.STREAM_API_TOKEN.encode() if settings.STREAM_API_TOKEN else None
+
+
+def verify_stream_token(request: Request, token: Optional[str] = Query(default=None)):
+    """Checks the Bearer token (or `token` query parameter) against STREAM_API_TOKEN."""
+    if _STREAM_TOKEN is None:
+        # Fail closed: without a token there is no way to tell who is watching a meeting
+        raise HTTPException(status_code=404, detail="Progress stream is disabled")
+
+    auth = request.headers.get("authorization", "")
+    supplied = auth[7:] if auth.lower().startswith("bearer ") else token
+    if not supplied or not hmac.compare_digest(_STREAM_TOKEN, supplied.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing token")
+
+
+async def _redis_events(meeting_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """Progress summaries published by whichever process (usually the ARQ worker) runs the pipeline."""
+    pubsub = db.redis.pubsub()
+    await pubsub.subscribe(PROGRESS_CHANNEL.format(meeting_id))
+    try:
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                yield orjson.loads(message["data"])
+    finally:
+        await pubsub.aclose()
+
+
+async def _local_events(meeting_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """Progress summaries from a pipeline running in this process (no-Redis mode)."""
+    queue = subscribe_progress(meeting_id)
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        unsubscribe_progress(meeting_id, queue)
+
+
+@router.get("/meetings/{meeting_id}/stream", dependencies=[Depends(verify_stream_token)])
+async def stream_meeting_progress(meeting_id: str, request: Request):
+    """
+    Streams per-node progress events for the pipeline running on `meeting_id`.
+    The stream closes once the pipeline completes (or pauses for human review).
+    """
+    events = _redis_events(meeting_id) if db.redis is not None else _local_events(meeting_id)
+    logger.info(f"📡 SSE client subscribed to meeting {meeting_id}")
+
+    async def event_generator():
+        try:
+            async for event in events:
+                if await request.is_disconnected():
+                    break
+
+                yield {"event": event["type"], "data": json.dumps(event)}
+                if event["type"] == "completed":
+                    break
+        finally:
+            await events.aclose()
+            logger.info(f"📴 SSE client unsubscribed from meeting {meeting_id}")
+
+    return EventSourceResponse(event_generator())
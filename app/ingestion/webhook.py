@@ -1,6 +1,13 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
 from pydantic import BaseModel
+from cachetools import TTLCache
+import asyncio
+import hmac
 import logging
+import orjson
+from arq import create_pool
+from arq.connections import RedisSettings
+from app.config import settings
 from app.services.fireflies import fireflies_client
 from app.services.storage import db
 from app.state import MeetingState
@@ -8,8 +15,31 @@ from app.state import MeetingState
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Process-level in-memory deduplication (Set)
-SEEN_MEETINGS = set()
+# Process-level in-memory deduplication - bounded L1 cache in front of Redis/MongoDB
+# (TTLCache evicts least-recently-used entries once full, on top of the 24h expiry)
+SEEN_MEETINGS = TTLCache(maxsize=100_000, ttl=86400)
+
+# Accept 'Transcription completed' (what we saw) or 'meeting.completed' (what documentation sometimes says)
+_VALID_EVENTS = frozenset({"Transcription completed", "meeting.completed"})
+
+_WEBHOOK_KEY = settings.FIREFLIES_WEBHOOK_SECRET.encode() if settings.FIREFLIES_WEBHOOK_SECRET else None
+
+# ARQ job queue (created lazily; None when Redis is not configured)
+_queue = None
+
+async def get_queue():
+    """
+    Returns the shared ARQ Redis pool, or None to fall back to in-process BackgroundTasks.
+    """
+    global _queue
+    if _queue is None and settings.REDIS_URL:
+        _queue = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    return _queue
+
+async def close_queue():
+    """Closes the ARQ pool (called on app shutdown)."""
+    if _queue is not None:
+        await _queue.aclose()
 
 class FirefliesPayload(BaseModel):
     meetingId: str
@@ -21,96 +51,144 @@ async def process_meeting_task(meeting_id: str):
     Fetches transcript and saves to DB.
     """
     if meeting_id in SEEN_MEETINGS:
-        logger.info(f"⏩ Skipping duplicate meeting_id: {meeting_id}")
+        logger.info("⏩ Skipping duplicate meeting_id: %s", meeting_id)
         return
 
-    SEEN_MEETINGS.add(meeting_id)
+    SEEN_MEETINGS[meeting_id] = True
     
-    print(f"\n{'='*60}")
-    print(f"🚀 STARTING INGESTION FOR MEETING: {meeting_id}")
-    print(f"{'='*60}")
+    logger.info("🚀 STARTING INGESTION FOR MEETING: %s", meeting_id)
     
     # Auto-approve any abandoned active_review meetings before processing new one
     await db.auto_approve_active_reviews()
     
     try:
-        logger.info(f"📥 Fetching transcript from Fireflies...")
-        meeting_state = fireflies_client.get_transcript(meeting_id)
-        print(f"✅ Transcript Fetched: \"{meeting_state.metadata.title}\"")
-        print(f"   - Participants: {len(meeting_state.metadata.participants)}")
-        print(f"   - Segments: {len(meeting_state.transcript)}")
+        logger.info("📥 Fetching transcript from Fireflies...")
+        meeting_state = await fireflies_client.get_transcript(meeting_id)
+        logger.info(
+            "✅ Transcript Fetched: \"%s\" (participants=%d, segments=%d)",
+            meeting_state.metadata.title,
+            len(meeting_state.metadata.participants),
+            len(meeting_state.transcript)
+        )
         
-        # Save 'TRANSCRIPT_FETCHED' state (conceptually)
-        # We start with validation=False by default in the model
-        await db.save_meeting(meeting_state)
-        print(f"💾 Saved to MongoDB (id={meeting_id})")
+        # Record 'TRANSCRIPT_FETCHED' with a small marker document; the full state
+        # (transcript included) is written once, after the pipeline
+        await db.mark_ingested(meeting_state)
+        logger.info("💾 Marked as ingested in MongoDB (id=%s)", meeting_id)
         
         # Trigger Intelligence Pipeline (Council Architecture)
         from app.graph.workflow_council import run_council_pipeline
-        print(f"🧠 Running Council Intelligence Pipeline...")
+        logger.info("🧠 Running Council Intelligence Pipeline...")
         
         # Run pipeline - will pause at human_review
         final_state = await run_council_pipeline(meeting_state, thread_id=meeting_id)
         
-        # Save state at checkpoint (may be partial if paused)
-        await db.save_meeting(final_state)
-        print(f"💾 Updated MongoDB with Council Results")
+        # Save state at checkpoint (may be partial if paused) and notify Slack.
+        # Independent I/O against different services - run them concurrently.
+        # A paused meeting is saved already activated for the feedback loop (one write).
+        from app.services.slack import slack_service
+        paused = final_state.human_feedback.status == "pending"
+        save_result, notify_result = await asyncio.gather(
+            db.save_and_activate(final_state) if paused else db.save_meeting(final_state),
+            slack_service.send_notification(final_state),
+            return_exceptions=True
+        )
+        if isinstance(notify_result, Exception):
+            logger.error("❌ Slack notification failed for %s: %s", meeting_id, notify_result)
+        if isinstance(save_result, Exception):
+            logger.error("❌ Saving council results failed for %s: %s", meeting_id, save_result)
+            raise save_result
+        logger.info("💾 Updated MongoDB with Council Results")
 
         # Check if we hit the human review checkpoint
-        if final_state.human_feedback.status == "pending":
-            # Pipeline paused, send draft to Slack for review
-            print(f"⏸️ Pipeline paused at human review checkpoint")
-            from app.services.slack import slack_service
-            slack_service.send_notification(final_state)
-            print(f"📢 Draft sent to Slack for human review")
-            
-            # CRITICAL: Activate this meeting for feedback loop
-            final_state.human_feedback.status = "active_review"
-            await db.save_meeting(final_state)
-            print(f"🔄 Activated for review (status='active_review')")
-            print(f"ℹ️ Waiting for user feedback via /slack/events...")
+        if paused:
+            # Pipeline paused, draft went to Slack for review
+            logger.info("⏸️ Pipeline paused at human review checkpoint; draft sent to Slack")
+            logger.info("🔄 Activated for review (status='active_review'); waiting for feedback via /slack/events")
         else:
             # Pipeline completed without human intervention (unlikely in Council arch)
-            from app.services.slack import slack_service
-            slack_service.send_notification(final_state)
-            print(f"📢 Final notification sent to Slack")
+            logger.info("📢 Final notification sent to Slack")
         
-        print(f"{'='*60}")
-        print(f"✨ COMPLETED INGESTION FOR {meeting_id}")
-        print(f"{'='*60}\n")
+        logger.info("✨ COMPLETED INGESTION FOR %s", meeting_id)
         
     except Exception as e:
-        logger.error(f"❌ Error processing meeting {meeting_id}: {e}")
-        print(f"❌ FAILED: {e}")
+        logger.error("❌ Error processing meeting %s: %s", meeting_id, e)
         await db.mark_failed(meeting_id, str(e))
 
+def verify_fireflies_signature(request: Request, body: bytes):
+    """
+    Verifies the x-hub-signature header (HMAC-SHA256 of the raw body) using the webhook secret.
+    """
+    if _WEBHOOK_KEY is None:
+        logger.warning("⚠️ FIREFLIES_WEBHOOK_SECRET not set. Skipping verification (UNSAFE).")
+        return
+
+    signature = request.headers.get("x-hub-signature")
+    if not signature:
+        raise HTTPException(status_code=400, detail="Missing signature header")
+
+    expected = hmac.digest(_WEBHOOK_KEY, body, "sha256").hex()
+    # Accept both bare hex and the "sha256=<hex>" form
+    if not hmac.compare_digest(expected, signature.removeprefix("sha256=")):
+        raise HTTPException(status_code=403, detail="Invalid signature")
+
 @router.post("/webhook/fireflies")
-async def fireflies_webhook(payload: FirefliesPayload, background_tasks: BackgroundTasks):
+async def fireflies_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Contract A: Ingestion
     Payload: {'meetingId': '...', 'eventType': 'Transcription completed'}
+    
+    Invalid signatures and irrelevant events are rejected before any dedup I/O.
     """
-    print(f"\n🔔 WEBHOOK RECEIVED: Event='{payload.eventType}' | ID='{payload.meetingId}'")
+    body = await request.body()
+    verify_fireflies_signature(request, body)
     
-    # Accept 'Transcription completed' (what we saw) or 'meeting.completed' (what documentation sometimes says)
-    valid_events = ["Transcription completed", "meeting.completed"]
+    try:
+        payload = FirefliesPayload(**orjson.loads(body))
+    except Exception as e:
+        logger.error("Malformed Fireflies payload: %s", e)
+        raise HTTPException(status_code=400, detail="Invalid payload")
     
-    if payload.eventType in valid_events:
+    logger.info("🔔 WEBHOOK RECEIVED: Event='%s' | ID='%s'", payload.eventType, payload.meetingId)
+    
+    if payload.eventType in _VALID_EVENTS:
         if payload.meetingId in SEEN_MEETINGS:
-           logger.info(f"✋ Ignored duplicate webhook for {payload.meetingId} (Memory)")
+           logger.info("✋ Ignored duplicate webhook for %s (Memory)", payload.meetingId)
            return {"status": "ignored_duplicate_mem"}
 
-        # Persistent Check (MongoDB)
-        if await db.meeting_exists(payload.meetingId):
-            logger.info(f"✋ Ignored duplicate webhook for {payload.meetingId} (DB)")
-            # Add to memory so we don't hit DB again this run
-            SEEN_MEETINGS.add(payload.meetingId)
-            return {"status": "ignored_duplicate_db"}
+        # Cross-worker Check (Redis SET NX) - first webhook across the fleet wins
+        if not await db.claim_meeting(payload.meetingId):
+            logger.info("✋ Ignored duplicate webhook for %s (Redis)", payload.meetingId)
+            SEEN_MEETINGS[payload.meetingId] = True
+            return {"status": "ignored_duplicate_redis"}
+
+        # Everything after the claim may fail (MongoDB, queue); the claim must then be
+        # released, otherwise Fireflies' retry would be dropped as a Redis duplicate
+        try:
+            # Persistent Check (MongoDB)
+            if await db.meeting_exists(payload.meetingId):
+                logger.info("✋ Ignored duplicate webhook for %s (DB)", payload.meetingId)
+                # Add to memory so we don't hit DB again this run
+                SEEN_MEETINGS[payload.meetingId] = True
+                return {"status": "ignored_duplicate_db"}
 
-        # Enqueue heavy lifting
-        background_tasks.add_task(process_meeting_task, payload.meetingId)
-        print(f"⏳ Task enqueued for background processing...")
+            # Enqueue heavy lifting
+            queue = await get_queue()
+            if queue is not None:
+                # Run on the ARQ worker pool; _job_id makes duplicate enqueues a no-op
+                job = await queue.enqueue_job("process_meeting", payload.meetingId, _job_id=payload.meetingId)
+                if job is None:
+                    logger.info("✋ Ignored duplicate webhook for %s (Queue)", payload.meetingId)
+                    return {"status": "ignored_duplicate_queue"}
+                logger.info("⏳ Job enqueued for worker processing...")
+            else:
+                background_tasks.add_task(process_meeting_task, payload.meetingId)
+                logger.info("⏳ Task enqueued for background processing...")
+        except Exception as e:
+            logger.error("❌ Failed to dispatch meeting %s: %s", payload.meetingId, e)
+            await db.release_meeting(payload.meetingId)
+            raise HTTPException(status_code=503, detail="Temporarily unavailable, retry later")
         return {"status": "received"}
     
-    print(f"⚠️ Ignored event type: {payload.eventType}")
+    logger.info("⚠️ Ignored event type: %s", payload.eventType)
     return {"status": "ignored_event", "event": payload.eventType}
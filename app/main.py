@@ -1,19 +1,61 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.ingestion.webhook import router as webhook_router
+from fastapi.responses import ORJSONResponse
+from app.ingestion.webhook import router as webhook_router, close_queue
 from app.ingestion.slack_events import router as slack_events_router
 from app.ingestion.interactions import router as interactions_router
+from app.ingestion.stream import router as stream_router
+from app.services.clients import close_http_clients
 from app.config import settings
+from app.services.storage import db, MONGO_POOL_OPTIONS
 import logging
+import logging.handlers
+import queue
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging: handlers enqueue records and a listener thread does the actual I/O,
+# so request coroutines never block on stdout
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(), respect_handler_level=True
+)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Cube Intelligence API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Per-worker startup/shutdown.
+    Runs inside each worker process, so every worker owns (and closes) its own Mongo pool.
+    """
+    _log_listener.start()
+    await db.ensure_indexes()
+    await db.ensure_bloom_filter()
+    logger.info(
+        f"🗄️ MongoDB pool: maxPoolSize={MONGO_POOL_OPTIONS['maxPoolSize']}, "
+        f"minPoolSize={MONGO_POOL_OPTIONS['minPoolSize']}, "
+        f"waitQueueTimeoutMS={MONGO_POOL_OPTIONS['waitQueueTimeoutMS']}"
+    )
+    yield
+    await close_queue()
+    await close_http_clients()
+    await db.refinement_audit.aclose()
+    await db.close()
+    logger.info("🗄️ MongoDB client closed")
+    _log_listener.stop()
+
+
+app = FastAPI(
+    title="Cube Intelligence API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Include Routers
 app.include_router(webhook_router)
 app.include_router(slack_events_router)
 app.include_router(interactions_router)
+app.include_router(stream_router)
 
 @app.get("/health")
 def health_check():
@@ -0,0 +1,17 @@
+"""
+Pooled outbound HTTP clients (Fireflies, Slack service, Slack replies).
+
+Both the API lifespan and the ARQ worker close them through close_http_clients(),
+so the two shutdown paths can't drift apart.
+"""
+
+from app.ingestion.slack_common import close_client as close_slack_common_client
+from app.services.fireflies import fireflies_client
+from app.services.slack import slack_service
+
+
+async def close_http_clients():
+    """Closes every shared HTTP client (called on app and worker shutdown)."""
+    await slack_service.client.aclose()
+    await fireflies_client.client.aclose()
+    await close_slack_common_client()
@@ -1,4 +1,5 @@
-import requests
+import httpx
+import orjson
 import logging
 from app.config import settings
 from app.state import MeetingState, MeetingMetadata, TranscriptSegment
@@ -7,15 +8,8 @@ logger = logging.getLogger(__name__)
 
 class FirefliesClient:
     API_URL = "https://api.fireflies.ai/graphql"
-
-    def __init__(self):
-        self.headers = {
-            "Authorization": f"Bearer {settings.FIREFLIES_API_KEY}",
-            "Content-Type": "application/json"
-        }
-
-    def get_transcript(self, meeting_id: str) -> MeetingState:
-        query = """
+    # Built once per process; only variables.id changes between calls
+    _QUERY = """
         query Transcript($id: String!) {
             transcript(id: $id) {
                 id
@@ -30,20 +24,32 @@ class FirefliesClient:
             }
         }
         """
-        
+
+    def __init__(self):
+        self.headers = {
+            "Authorization": f"Bearer {settings.FIREFLIES_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        # Shared async client: reuses the TCP+TLS connection to api.fireflies.ai
+        # and never blocks the event loop. Connection failures are retried.
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=10,
+            http2=True,
+            transport=httpx.AsyncHTTPTransport(retries=3, http2=True)
+        )
+
+    async def get_transcript(self, meeting_id: str) -> MeetingState:
         try:
-            response = requests.post(
+            response = await self.client.post(
                 self.API_URL, 
-                json={"query": query, "variables": {"id": meeting_id}}, 
-                headers=self.headers,
-                timeout=10
+                content=orjson.dumps({"query": self._QUERY, "variables": {"id": meeting_id}})
             )
-            if not response.ok:
-                logger.error(f"Fireflies API Failed: {response.text}")
-                print(f"❌ Fireflies API Error Body: {response.text}")
+            if not response.is_success:
+                logger.error("❌ Fireflies API Failed: %s", response.text)
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Debug: Log what we got from Fireflies
             logger.info(f"🔍 DEBUG: Fireflies API response keys: {list(data.keys())}")
@@ -73,18 +79,19 @@ class FirefliesClient:
                 participants=t_data.get("participants", [])
             )
 
-            transcript_segments = []
             sentences = t_data.get("sentences") or []  # Handle None when no speech in meeting
             if not sentences:
                 logger.warning(f"⚠️ Meeting {meeting_id} has no sentences in transcript")
             
-            for s in sentences:
-                segment = TranscriptSegment(
+            # Every field is coerced to str right here, so skip per-segment validation
+            transcript_segments = [
+                TranscriptSegment.model_construct(
                     speaker=s.get("speaker_name") or "Unknown",
                     text=s.get("text") or "",
                     timestamp=str(s.get("start_time"))
                 )
-                transcript_segments.append(segment)
+                for s in sentences
+            ]
 
             return MeetingState(
                 meeting_id=meeting_id,
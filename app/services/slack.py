@@ -1,21 +1,38 @@
-import requests
+import httpx
+import orjson
 import logging
+from itertools import chain
 from app.config import settings
 from app.state import MeetingState
 
 logger = logging.getLogger(__name__)
 
+# Static Block Kit fragments (built once, shared by every message)
+_DIVIDER = {"type": "divider"}
+_FOOTER_HINT = {
+    "type": "context",
+    "elements": [
+        {"type": "mrkdwn", "text": "💡 _Reply to refine, or click Approve to open Gmail with draft_"}
+    ]
+}
+_NO_COMMITMENTS = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": "*Action Items:*\n_No explicit commitments found._"}
+}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class SlackService:
     def __init__(self):
         self.webhook_url = settings.SLACK_WEBHOOK_URL
+        # Shared async client: reuses connections to hooks.slack.com / slack.com.
+        # Only connection failures are retried so a message is never posted twice.
+        self.client = httpx.AsyncClient(
+            timeout=10,
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
 
-    def send_notification(self, state: MeetingState, channel_id: str = None):
-        """
-        Sends the formatted meeting state to Slack.
-        - If channel_id is provided, uses chat.postMessage (Bot Token).
-        - If channel_id is MISSING, falls back to Webhook URL (Legacy/Default).
-        """
-        
+    def _build_blocks(self, state: MeetingState) -> list:
+        """Builds the Block Kit message for a meeting state."""
         # Build Blocks (Common Logic)
         blocks = [
             {
@@ -33,7 +50,7 @@ class SlackService:
                     {"type": "mrkdwn", "text": f"*Intent:*\n{state.intent_context.meeting_type or 'N/A'}"}
                 ]
             },
-            {"type": "divider"}
+            _DIVIDER
         ]
 
         # Executive Summary
@@ -45,14 +62,12 @@ class SlackService:
             }
         })
 
-        # Decisions
-        all_decisions = []
-        for t in state.topics:
-            if t.decisions:
-                all_decisions.extend(t.decisions)
+        # Decisions (single pass over all topics' decisions)
+        decisions_text = "\n".join(
+            f"• {d}" for d in chain.from_iterable(t.decisions for t in state.topics if t.decisions)
+        )
         
-        if all_decisions:
-            decisions_text = "\n".join([f"• {d}" for d in all_decisions])
+        if decisions_text:
             blocks.append({
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": f"*Key Decisions:*\n{decisions_text}"}
@@ -60,23 +75,18 @@ class SlackService:
 
         # Action Items
         if state.commitments:
-            tasks_text = ""
-            for c in state.commitments:
-                tasks_text += f"• *{c.owner}*: {c.task} (Due: {c.due})\n"
+            tasks_text = "".join(f"• *{c.owner}*: {c.task} (Due: {c.due})\n" for c in state.commitments)
             
             blocks.append({
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": f"*Action Items:*\n{tasks_text}"}
             })
         else:
-             blocks.append({
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": "*Action Items:*\n_No explicit commitments found._"}
-            })
+             blocks.append(_NO_COMMITMENTS)
 
         # Email Draft - split into multiple blocks if too long (Slack limit: 3000 chars per section)
         if state.email.body:
-             blocks.append({"type": "divider"})
+             blocks.append(_DIVIDER)
              
              # ===== CLIENT EMAIL SECTION =====
              # Slack section text limit is 3000 chars, use 2900 to be safe
@@ -120,7 +130,7 @@ class SlackService:
              
              # ===== INTERNAL ACTION PLAN SECTION =====
              if state.email.internal_action_plan:
-                 blocks.append({"type": "divider"})
+                 blocks.append(_DIVIDER)
                  internal_header = "*🔒 INTERNAL USE ONLY*\n"
                  internal_body = state.email.internal_action_plan
                  full_internal_text = f"{internal_header}{internal_body}"
@@ -155,7 +165,7 @@ class SlackService:
                                 "text": {"type": "mrkdwn", "text": f"...{chunk}"}
                              })
 
-        blocks.append({"type": "divider"})
+        blocks.append(_DIVIDER)
         
         # Build Gmail Compose URL with pre-filled draft
         # IMPORTANT: Only use the CLIENT EMAIL (body), not internal action plan
@@ -188,12 +198,18 @@ class SlackService:
         })
         
         # Footer hint
-        blocks.append({
-            "type": "context",
-            "elements": [
-                {"type": "mrkdwn", "text": "💡 _Reply to refine, or click Approve to open Gmail with draft_"}
-            ]
-        })
+        blocks.append(_FOOTER_HINT)
+
+        return blocks
+
+    async def send_notification(self, state: MeetingState, channel_id: str = None):
+        """
+        Sends the formatted meeting state to Slack.
+        - If channel_id is provided, uses chat.postMessage (Bot Token).
+        - If channel_id is MISSING, falls back to Webhook URL (Legacy/Default).
+        """
+        
+        blocks = self._build_blocks(state)
         
         # SENDING LOGIC
         try:
@@ -209,9 +225,9 @@ class SlackService:
                     "blocks": blocks,
                     "text": f"New Intelligence for {state.metadata.title}" # Fallback text
                 }
-                response = requests.post(url, headers=headers, json=payload, timeout=10)
+                response = await self.client.post(url, headers=headers, content=orjson.dumps(payload))
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 if not data.get("ok"):
                     logger.error(f"❌ Slack API Error (postMessage): {data.get('error')}")
                 else:
@@ -222,20 +238,20 @@ class SlackService:
             if self.webhook_url:
                 payload = {"blocks": blocks}
                 
-                # Detailed debug logging
-                import json as json_module
-                payload_str = json_module.dumps(payload, indent=2)
-                payload_size = len(payload_str)
+                # Serialize once; the same bytes are sent and used for debug logging
+                payload_bytes = orjson.dumps(payload)
+                payload_str = payload_bytes.decode()
+                payload_size = len(payload_bytes)
                 
                 logger.info(f"📤 Sending to Slack Webhook...")
-                logger.info(f"   Payload size: {payload_size} chars")
+                logger.info(f"   Payload size: {payload_size} bytes")
                 logger.info(f"   Number of blocks: {len(blocks)}")
                 
                 # Log each block type and size
                 for i, block in enumerate(blocks):
-                    block_str = json_module.dumps(block)
+                    block_size = len(orjson.dumps(block))
                     block_type = block.get("type", "unknown")
-                    logger.info(f"   Block {i}: type={block_type}, size={len(block_str)} chars")
+                    logger.info(f"   Block {i}: type={block_type}, size={block_size} bytes")
                     
                     # If it's an actions block, log the button URL length
                     if block_type == "actions":
@@ -246,7 +262,7 @@ class SlackService:
                 # Log the full payload for debugging
                 logger.debug(f"   Full payload:\n{payload_str[:2000]}...")
                 
-                response = requests.post(self.webhook_url, json=payload, timeout=10)
+                response = await self.client.post(self.webhook_url, headers=_JSON_HEADERS, content=payload_bytes)
                 
                 # Log response details on error
                 if response.status_code != 200:
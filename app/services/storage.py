@@ -1,13 +1,285 @@
+import asyncio
+import functools
+import logging
+from typing import AsyncIterator, List, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
+import redis.asyncio as redis
+from cachetools import TTLCache
+from redis.exceptions import ResponseError
+from pymongo import ReturnDocument, WriteConcern
+from pymongo.errors import DuplicateKeyError
 from app.config import settings
-from app.state import MeetingState
+from app.state import MeetingState, TranscriptSegment
 from datetime import datetime, timezone
 
+logger = logging.getLogger(__name__)
+
+SEEN_KEY_TTL_SECONDS = 86400  # Redis dedup keys outlive any webhook retry window
+
+# RedisBloom filter of every stored meeting_id: a "no" skips the MongoDB existence check
+BLOOM_KEY = "cube:seen"
+BLOOM_ERROR_RATE = 0.001
+BLOOM_CAPACITY = 1_000_000
+# Set while the filter is being (re)built and whenever an add may have been lost; while
+# present a filter miss is not trusted and the next ensure_bloom_filter() rebuilds the filter
+BLOOM_STALE_KEY = "cube:seen:stale"
+
+# Short-lived in-process cache of hot meetings (Slack feedback loops re-read the same one)
+MEETING_CACHE_SIZE = 128
+MEETING_CACHE_TTL_SECONDS = 5
+
+# Connection pool sizing shared by every consumer of the Mongo client.
+# Bursty Slack traffic otherwise starves the default pool and serializes saves.
+MONGO_POOL_OPTIONS = {
+    "maxPoolSize": 50,
+    "minPoolSize": 5,
+    "waitQueueTimeoutMS": 2000,
+    "serverSelectionTimeoutMS": 2000,
+    "retryWrites": True,
+    "uuidRepresentation": "standard",
+}
+
+
+def create_mongo_client() -> AsyncIOMotorClient:
+    """
+    Builds the process-wide Motor client with a right-sized connection pool.
+    connect=False defers server discovery until the first operation.
+    """
+    return AsyncIOMotorClient(settings.MONGODB_URI, connect=False, **MONGO_POOL_OPTIONS)
+
+
+class AuditBuffer:
+    """
+    Batches append-only audit documents into a single insert_many.
+    push() never awaits the database: documents are queued and a background
+    task flushes them every `flush_interval` seconds or once `max_batch`
+    documents are waiting, whichever comes first.
+    """
+
+    def __init__(self, collection, max_batch: int = 256, flush_interval: float = 0.1):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task = None
+
+    def push(self, doc: dict):
+        """Queues a document for the next batch (must be called from the event loop)."""
+        self.queue.put_nowait(doc)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            # asyncio.timeout rather than wait_for: on 3.11, wait_for swallows a cancel that
+            # races with a completed get(), which left aclose() waiting on the task forever
+            try:
+                async with asyncio.timeout_at(loop.time() + self.flush_interval):
+                    while len(batch) < self.max_batch:
+                        batch.append(await self.queue.get())
+            except TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # Hand the partial batch back so aclose() can flush it
+                for doc in batch:
+                    self.queue.put_nowait(doc)
+                raise
+            await self._flush(batch)
+
+    async def _flush(self, batch: list):
+        # No bypass_document_validation: pymongo rejects it on unacknowledged (w=0) writes
+        try:
+            await self.collection.insert_many(batch, ordered=False)
+        except Exception as e:
+            # Audit data is best-effort: never let a failed flush kill the buffer
+            logger.error(f"❌ Failed to flush {len(batch)} audit document(s): {e}")
+
+    async def aclose(self):
+        """Stops the flush task and writes whatever is still queued (called on shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        batch = []
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        for start in range(0, len(batch), self.max_batch):
+            await self._flush(batch[start:start + self.max_batch])
+
+
 class StorageService:
     def __init__(self):
-        self.client = AsyncIOMotorClient(settings.MONGODB_URI)
+        self.client = create_mongo_client()
         self.db = self.client.get_database("cube_intelligence")
         self.meetings = self.db.get_collection("meetings")
+        # Transcripts are written once per meeting and kept out of the (frequently rewritten)
+        # meeting documents; see save_transcript() / _attach_transcript()
+        self.transcripts = self.db.get_collection("transcripts")
+        # Refinement requests are an audit log: unacknowledged writes, batched
+        self.refinement_audit = AuditBuffer(
+            self.db.get_collection(
+                "refinement_requests",
+                write_concern=WriteConcern(w=0, j=False)
+            )
+        )
+        # Shared across workers/pods; without it dedup falls back to per-process + MongoDB
+        self.redis = redis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+        self.bloom_enabled = False  # Set by ensure_bloom_filter() once the filter is ready
+        self._bloom_checked = False  # ensure_bloom_filter() runs once per process
+        self._bloom_lock = asyncio.Lock()
+        # True after a local BF.ADD failed and the shared stale marker couldn't be set either
+        self._bloom_stale_unreported = False
+        # Raw documents keyed by (meeting_id, fields); invalidated on every write to the meeting
+        self._cache = TTLCache(maxsize=MEETING_CACHE_SIZE, ttl=MEETING_CACHE_TTL_SECONDS)
+        # meeting_ids known to be stored (meetings are never deleted, so positives stay true)
+        self._exists_cache = TTLCache(maxsize=10_000, ttl=86400)
+        # meeting_ids whose transcript this process already wrote (skips re-sending it)
+        self._transcript_saved = TTLCache(maxsize=10_000, ttl=86400)
+
+    async def close(self):
+        """Closes the underlying clients (and their connection pools)."""
+        self.client.close()
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    async def ensure_indexes(self):
+        """
+        Creates the indexes the service relies on. Idempotent; called once on app startup.
+        The unique meeting_id index turns lookups/upserts into index probes and makes
+        concurrent upserts for the same meeting fail instead of double-writing.
+        The (human_feedback.status, last_modified) index serves claim_pending_meeting's
+        filter + sort as a bounded index scan instead of COLLSCAN + in-memory SORT.
+        """
+        await self.meetings.create_index("meeting_id", unique=True)
+        await self.transcripts.create_index("meeting_id", unique=True)
+        await self.meetings.create_index(
+            [("human_feedback.status", 1), ("last_modified", -1)]
+        )
+        logger.info("🗂️ MongoDB indexes ensured")
+
+    async def ensure_bloom_filter(self):
+        """
+        Reserves the RedisBloom filter of stored meeting_ids. Runs once per process: on app and
+        worker startup, or lazily on the first write from any other process (scripts, tests),
+        so every writer adds to the filter. When the filter is missing - or a previous add was
+        lost (BLOOM_STALE_KEY) - it is (re)built from MongoDB so existing meetings are never
+        reported as missing. BLOOM_STALE_KEY is set before the filter is reserved and only
+        cleared once the backfill is complete, so no process trusts a miss in between.
+        Stays disabled if Redis or the RedisBloom module is unavailable.
+        """
+        if self.redis is None:
+            return
+        async with self._bloom_lock:
+            if self._bloom_checked:
+                return
+            self._bloom_checked = True
+            try:
+                if await self.redis.exists(BLOOM_STALE_KEY):
+                    logger.warning("⚠️ Bloom filter marked stale; rebuilding from MongoDB")
+                    await self.redis.delete(BLOOM_KEY)
+                if not await self.redis.exists(BLOOM_KEY):
+                    await self.redis.set(BLOOM_STALE_KEY, "1")
+                    try:
+                        await self.redis.execute_command(
+                            "BF.RESERVE", BLOOM_KEY, BLOOM_ERROR_RATE, BLOOM_CAPACITY
+                        )
+                    except ResponseError as e:
+                        # Another process reserved it first; backfilling again is idempotent
+                        if "exists" not in str(e).lower():
+                            raise
+                    count = await self._backfill_bloom_filter()
+                    await self.redis.delete(BLOOM_STALE_KEY)
+                    logger.info(f"🌸 Bloom filter created and backfilled with {count} meeting(s)")
+            except ResponseError as e:
+                logger.warning(f"⚠️ RedisBloom unavailable ({e}). Dedup falls back to MongoDB.")
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Redis unavailable ({e}). Dedup falls back to MongoDB.")
+                return
+            self.bloom_enabled = True
+
+    async def _backfill_bloom_filter(self) -> int:
+        """Adds every stored meeting_id to the (already reserved) filter, 1000 per round trip."""
+        count = 0
+        batch = []
+        async for doc in self.meetings.find({}, {"_id": 0, "meeting_id": 1}):
+            batch.append(doc["meeting_id"])
+            if len(batch) >= 1000:
+                await self._bloom_insert(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            await self._bloom_insert(batch)
+            count += len(batch)
+        return count
+
+    async def _bloom_insert(self, meeting_ids: List[str]):
+        """
+        Adds ids to the filter without ever creating it: if the key was evicted or lost in a
+        Redis restart, NOCREATE makes this raise instead of silently starting an empty filter.
+        """
+        await self.redis.execute_command("BF.INSERT", BLOOM_KEY, "NOCREATE", "ITEMS", *meeting_ids)
+
+    def _invalidate(self, meeting_id: str):
+        """Drops every cached projection of a meeting after it was written."""
+        for key in [k for k in self._cache if k[0] == meeting_id]:
+            self._cache.pop(key, None)
+
+    async def _remember_meeting(self, meeting_id: str):
+        """
+        Records a stored meeting_id in the local exists-cache and the Bloom filter.
+        A failed add marks the filter stale (shared via Redis) so misses stop being trusted.
+        """
+        self._exists_cache[meeting_id] = True
+        if self.redis is None:
+            return
+        await self.ensure_bloom_filter()
+        if not self.bloom_enabled:
+            return
+        try:
+            await self._bloom_insert([meeting_id])
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to add {meeting_id} to Bloom filter: {e}")
+            await self._mark_bloom_stale()
+
+    async def _mark_bloom_stale(self):
+        """Flags the shared filter as incomplete; retried on later lookups if Redis is down."""
+        self._bloom_stale_unreported = True
+        try:
+            await self.redis.set(BLOOM_STALE_KEY, "1")
+            self._bloom_stale_unreported = False
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to mark Bloom filter stale: {e}")
+
+    async def claim_meeting(self, meeting_id: str) -> bool:
+        """
+        Atomically marks a meeting as seen across every worker (Redis SET NX EX).
+        Returns False if another webhook already claimed it.
+        Always returns True when Redis is not configured or unreachable
+        (callers still fall back to the MongoDB existence check).
+        """
+        if self.redis is None:
+            return True
+        try:
+            claimed = await self.redis.set(f"seen:{meeting_id}", "1", nx=True, ex=SEEN_KEY_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis claim failed for {meeting_id}, falling back to MongoDB: {e}")
+            return True
+        return bool(claimed)
+
+    async def release_meeting(self, meeting_id: str):
+        """Drops a claim taken by claim_meeting() so a webhook retry can process the meeting."""
+        if self.redis is None:
+            return
+        try:
+            await self.redis.delete(f"seen:{meeting_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to release claim for {meeting_id}: {e}")
 
     async def save_meeting(self, meeting_state: MeetingState):
         """
@@ -15,30 +287,154 @@ class StorageService:
         Uses upsert to ensure strict one-to-one mapping by meeting_id.
         Sets last_modified timestamp for proper sorting.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Set last_modified to current UTC time
         meeting_state.last_modified = datetime.now(timezone.utc).isoformat()
         
-        # Debug logging
-        logger.info(f"💾 DEBUG: Saving meeting {meeting_state.meeting_id[:15]}...")
-        logger.info(f"   human_feedback.status: {meeting_state.human_feedback.status}")
-        logger.info(f"   last_modified: {meeting_state.last_modified}")
+        # Debug logging (gated: the f-strings are built even when INFO is filtered out)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"💾 DEBUG: Saving meeting {meeting_state.meeting_id[:15]}...")
+            logger.info(f"   human_feedback.status: {meeting_state.human_feedback.status}")
+            logger.info(f"   last_modified: {meeting_state.last_modified}")
+        
+        # The transcript lives in its own collection and is written once, not on every save
+        if meeting_state.transcript:
+            await self.save_transcript(meeting_state)
+
+        # Dumping a large state is CPU-bound; keep it off the event loop.
+        # None-valued optionals are dropped (every Optional field defaults to None, so they
+        # round-trip unchanged); defaults are kept because queries filter on e.g. status="pending".
+        doc = await asyncio.to_thread(
+            meeting_state.model_dump, mode="python", exclude_none=True, exclude={"transcript"}
+        )
+
+        try:
+            await self.meetings.replace_one(
+                {"meeting_id": meeting_state.meeting_id},
+                doc,
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # Lost an upsert race: the document now exists, so a plain replace wins
+            logger.info(f"   Upsert race on {meeting_state.meeting_id[:15]}..., replacing existing document")
+            await self.meetings.replace_one({"meeting_id": meeting_state.meeting_id}, doc)
+
+        self._invalidate(meeting_state.meeting_id)
+        await self._remember_meeting(meeting_state.meeting_id)
         
-        await self.meetings.replace_one(
+        logger.info("✅ DEBUG: Meeting saved successfully")
+
+    async def save_transcript(self, meeting_state: MeetingState):
+        """
+        Stores the meeting's transcript in the transcripts collection, once.
+        $setOnInsert makes repeat calls no-ops server-side; repeat calls from this
+        process are skipped entirely so the segments aren't re-sent.
+        """
+        if meeting_state.meeting_id in self._transcript_saved:
+            return
+        segments = await asyncio.to_thread(
+            lambda: meeting_state.model_dump(mode="python", exclude_none=True, include={"transcript"})["transcript"]
+        )
+        await self.transcripts.update_one(
             {"meeting_id": meeting_state.meeting_id},
-            meeting_state.model_dump(),
+            {"$setOnInsert": {"meeting_id": meeting_state.meeting_id, "segments": segments}},
+            upsert=True,
+            bypass_document_validation=True  # Segments are already validated by pydantic
+        )
+        self._transcript_saved[meeting_state.meeting_id] = True
+
+    async def _attach_transcript(self, doc: dict) -> dict:
+        """
+        Fills in doc["transcript"] from the transcripts collection.
+        Documents saved before the split still embed their transcript and are left as-is.
+        """
+        if "transcript" not in doc:
+            stored = await self.transcripts.find_one(
+                {"meeting_id": doc["meeting_id"]}, {"_id": 0, "segments": 1}
+            )
+            doc["transcript"] = stored["segments"] if stored else []
+        return doc
+
+    async def save_and_activate(self, meeting_state: MeetingState):
+        """
+        Persists the meeting already flipped to "active_review" (Slack feedback loop).
+        The status goes into the replacement document itself, so this is one write
+        instead of a save followed by a status update.
+        """
+        meeting_state.human_feedback.status = "active_review"
+        await self.save_meeting(meeting_state)
+
+    async def patch_meeting(self, meeting_id: str, changes: dict) -> bool:
+        """
+        Applies a partial update ($set) to an existing meeting.
+        Use for status flips / refinements so the transcript is not re-sent on every save.
+        `changes` may use dotted paths (e.g. "human_feedback.status").
+        Returns False if no meeting matched.
+        """
+        result = await self.meetings.update_one(
+            {"meeting_id": meeting_id},
+            {"$set": {**changes, "last_modified": datetime.now(timezone.utc).isoformat()}}
+        )
+        self._invalidate(meeting_id)
+        logger.info(f"💾 Patched meeting {meeting_id[:15]}... fields: {list(changes.keys())}")
+        return result.matched_count > 0
+
+    async def mark_ingested(self, meeting_state: MeetingState):
+        """
+        Records that a meeting's transcript was fetched and stores the transcript (once).
+        Keeps the meeting visible to meeting_exists() while the pipeline runs;
+        the full state is persisted once by save_meeting() afterwards.
+        """
+        await self.save_transcript(meeting_state)
+        await self.meetings.update_one(
+            {"meeting_id": meeting_state.meeting_id},
+            {
+                "$setOnInsert": {"metadata": meeting_state.metadata.model_dump()},
+                "$set": {"last_modified": datetime.now(timezone.utc).isoformat()}
+            },
             upsert=True
         )
-        
-        logger.info(f"✅ DEBUG: Meeting saved successfully")
+        self._invalidate(meeting_state.meeting_id)
+        await self._remember_meeting(meeting_state.meeting_id)
 
-    async def get_meeting(self, meeting_id: str) -> MeetingState:
-        doc = await self.meetings.find_one({"meeting_id": meeting_id})
-        if not doc:
-            return None
-        return MeetingState(**doc)
+    async def get_meeting(self, meeting_id: str, fields: Optional[List[str]] = None) -> MeetingState:
+        """
+        Loads a meeting. Pass `fields` to fetch only those top-level fields
+        (the transcript is usually most of the document); the rest get model defaults,
+        so a partial state must be persisted with patch_meeting(), never save_meeting().
+        Documents are cached for a few seconds; each call still builds a fresh MeetingState.
+        """
+        key = (meeting_id, tuple(fields) if fields else None)
+        doc = self._cache.get(key)
+        if doc is None:
+            projection = {f: 1 for f in ["meeting_id", *fields]} if fields else None
+            doc = await self.meetings.find_one({"meeting_id": meeting_id}, projection)
+            if not doc:
+                return None
+            if not fields or "transcript" in fields:
+                await self._attach_transcript(doc)
+            self._cache[key] = doc
+        return MeetingState.model_validate(doc)
+
+    async def iter_transcript(self, meeting_id: str, limit: Optional[int] = None) -> AsyncIterator[TranscriptSegment]:
+        """
+        Streams a meeting's transcript segments in order, validating one at a time.
+        With `limit`, MongoDB unwinds and ships only the first `limit` segments.
+        Falls back to the embedded transcript of meetings saved before the split.
+        """
+        for collection, field in ((self.transcripts, "segments"), (self.meetings, "transcript")):
+            pipeline = [
+                {"$match": {"meeting_id": meeting_id}},
+                {"$project": {"_id": 0, field: 1}},
+                {"$unwind": f"${field}"},
+            ]
+            if limit is not None:
+                pipeline.append({"$limit": limit})
+            found = False
+            async for doc in collection.aggregate(pipeline):
+                found = True
+                yield TranscriptSegment.model_validate(doc[field])
+            if found:
+                return
 
     async def mark_failed(self, meeting_id: str, error: str):
         """
@@ -55,107 +451,125 @@ class StorageService:
             },
             upsert=True
         )
+        self._invalidate(meeting_id)
+        await self._remember_meeting(meeting_id)
 
     async def meeting_exists(self, meeting_id: str) -> bool:
         """
-        Efficiently checks if a meeting exists in the DB (projection=only _id).
+        Efficiently checks if a meeting exists in the DB.
+        Projecting only the indexed meeting_id (and not _id) makes this a covered query:
+        answered from the unique index without a FETCH of the document itself.
         """
-        doc = await self.meetings.find_one({"meeting_id": meeting_id}, {"_id": 1})
-        return doc is not None
+        if meeting_id in self._exists_cache:
+            return True
+        if self.bloom_enabled and self._bloom_stale_unreported:
+            await self._mark_bloom_stale()
+        if self.bloom_enabled and not self._bloom_stale_unreported:
+            # Bloom filters have no false negatives, so "not present" is definitive -
+            # unless the filter itself is gone (Redis restart/eviction: BF.EXISTS on a
+            # missing key is 0) or an add may have been lost (stale marker); then MongoDB
+            # decides. All three checks go out in one round trip.
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.execute_command("BF.EXISTS", BLOOM_KEY, meeting_id)
+                pipe.exists(BLOOM_KEY)
+                pipe.exists(BLOOM_STALE_KEY)
+                present, filter_exists, stale = await pipe.execute()
+                if not present and filter_exists and not stale:
+                    return False
+            except Exception as e:
+                logger.warning(f"⚠️ Bloom filter lookup failed, checking MongoDB: {e}")
+        exists = await self.meetings.find_one(
+            {"meeting_id": meeting_id}, {"_id": 0, "meeting_id": 1}
+        ) is not None
+        if exists:
+            self._exists_cache[meeting_id] = True
+        return exists
 
-    async def save_refinement_request(self, request_data: dict):
+    def save_refinement_request(self, request_data: dict):
         """
         Stores a user refinement request (from Slack).
+        Fire-and-forget: the document is buffered and written in a batch.
         """
-        refinements = self.db.get_collection("refinement_requests")
-        await refinements.insert_one(request_data)
+        self.refinement_audit.push(request_data)
 
-    async def get_latest_meeting(self) -> MeetingState:
+    async def get_latest_meeting(self, projection: Optional[dict] = None) -> MeetingState:
         """
         Retrieves the most recently modified meeting.
+        Pass a Mongo `projection` (e.g. {"meeting_id": 1, "metadata": 1}) to fetch only
+        those fields; omitted fields get model defaults and the transcript is not attached.
         """
         # Sort by natural insertion order or a timestamp if we had one indexed.
         # Ideally we'd have a 'processed_at' field, but _id is decent proxy for now along with our manual dates.
         # Actually, let's just sort by _id desc (natural creation order)
-        doc = await self.meetings.find_one({}, sort=[("_id", -1)])
+        doc = await self.meetings.find_one({}, projection, sort=[("_id", -1)])
         if not doc:
             return None
-        return MeetingState(**doc)
+        if projection is None:
+            await self._attach_transcript(doc)
+        return MeetingState.model_validate(doc)
     
-    async def get_pending_meeting(self) -> MeetingState:
+    async def claim_pending_meeting(self, fields: Optional[List[str]] = None) -> Optional[MeetingState]:
         """
-        Retrieves the meeting currently awaiting feedback.
-        
+        Returns the meeting that feedback should apply to, marked "active_review".
         Priority:
-        1. FIRST: Check for "active_review" status (meeting currently in Slack feedback loop)
-        2. FALLBACK: Check for "pending" status sorted by last_modified (newly paused meetings)
-        
-        This ensures follow-up feedback always applies to the same meeting until approved.
+        1. The meeting already in "active_review" (currently in the Slack feedback loop),
+           so follow-up feedback keeps applying to it until it is approved.
+        2. Otherwise the most recently modified "pending" meeting. The pending -> active_review
+           flip is a single atomic find_one_and_update, so concurrent feedback can't claim
+           two different meetings and no separate status update is needed.
+        `fields` limits the projection like get_meeting().
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # PRIORITY 1: Check for meeting in active review (currently in feedback loop)
-        logger.info("🔍 DEBUG: Checking for meetings in active_review status...")
-        active_doc = await self.meetings.find_one(
-            {"human_feedback.status": "active_review"}
-        )
-        
-        if active_doc:
-            logger.info(f"✅ DEBUG: Found ACTIVE REVIEW meeting: {active_doc['meeting_id']}")
-            logger.info(f"   status: active_review (in feedback loop)")
-            return MeetingState(**active_doc)
-        
-        # PRIORITY 2: Fall back to most recent pending meeting
-        logger.info("🔍 DEBUG: No active_review found, checking pending meetings...")
-        query = {
-            "human_feedback.status": "pending",
-            "last_modified": {"$exists": True}
-        }
-        
-        # Debug: First get ALL pending meetings to see what exists
-        all_pending = await self.meetings.find({"human_feedback.status": "pending"}).to_list(length=10)
-        logger.info(f"📊 DEBUG: Total pending meetings: {len(all_pending)}")
-        for meeting in all_pending:
-            has_timestamp = "last_modified" in meeting and meeting["last_modified"] is not None
-            logger.info(f"   - Meeting {meeting['meeting_id'][:15]}... | "
-                       f"has_last_modified: {has_timestamp} | "
-                       f"timestamp: {meeting.get('last_modified', 'NONE')}")
-        
-        # Now execute the actual query
-        doc = await self.meetings.find_one(
-            query,
-            sort=[("last_modified", -1)]  # Most recent modification first
-        )
-        
+        projection = {f: 1 for f in ["meeting_id", *fields]} if fields else None
+
+        doc = await self.meetings.find_one({"human_feedback.status": "active_review"}, projection)
         if not doc:
-            logger.warning(f"⚠️ DEBUG: No meeting found matching query!")
-            return None
-        
-        logger.info(f"✅ DEBUG: Found PENDING meeting: {doc['meeting_id']}")
-        logger.info(f"   last_modified: {doc.get('last_modified')}")
-        logger.info(f"   status: pending (will be activated on first feedback)")
-        
-        return MeetingState(**doc)
-    
+            doc = await self.meetings.find_one_and_update(
+                {"human_feedback.status": "pending", "last_modified": {"$exists": True}},
+                {"$set": {
+                    "human_feedback.status": "active_review",
+                    "last_modified": datetime.now(timezone.utc).isoformat()
+                }},
+                projection=projection,
+                sort=[("last_modified", -1)],  # Most recent modification first
+                return_document=ReturnDocument.AFTER
+            )
+            if not doc:
+                return None
+            self._invalidate(doc["meeting_id"])
+            logger.info(f"🔒 Claimed pending meeting {doc['meeting_id']} for review")
+
+        if not fields or "transcript" in fields:
+            await self._attach_transcript(doc)
+        return MeetingState.model_validate(doc)
+
     async def auto_approve_active_reviews(self) -> int:
         """
         Auto-approves any meetings with status='active_review'.
         Called when a new meeting arrives to clean up abandoned sessions.
         Returns count of meetings approved.
+        Already the bulk path: a single update_many round trip regardless of how many match.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         result = await self.meetings.update_many(
             {"human_feedback.status": "active_review"},
             {"$set": {"human_feedback.status": "approved"}}
         )
-        
         if result.modified_count > 0:
+            self._cache.clear()  # Touched meetings aren't known individually
             logger.info(f"🔄 Auto-approved {result.modified_count} abandoned meeting(s)")
         
         return result.modified_count
 
 
-db = StorageService()
+@functools.cache
+def get_db() -> StorageService:
+    """Returns the process-wide StorageService, creating it on first use."""
+    return StorageService()
+
+
+def __getattr__(name: str):
+    # `from app.services.storage import db` builds the service lazily, so importing this
+    # module for its helpers/constants doesn't construct clients
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -64,6 +64,11 @@ class CriticVerification(BaseModel):
     extractor_feedback: Optional[str] = None
     overall_status: str = "pending"  # "pending" | "approved" | "rejected"
 
+class RetryCounts(BaseModel):
+    """Critic rejection counters per agent (feeds MAX_RETRIES escalation)"""
+    strategist: int = 0
+    extractor: int = 0
+
 class HumanFeedback(BaseModel):
     """Human-in-the-Loop Feedback"""
     status: str = "pending"  # "pending" | "active_review" | "approved"
@@ -89,7 +94,7 @@ class MeetingState(BaseModel):
     
     # Control Flow (New)
     human_feedback: HumanFeedback = Field(default_factory=HumanFeedback)
-    retry_counts: Dict[str, int] = Field(default_factory=dict)  # {"strategist": 0, "extractor": 0}
+    retry_counts: RetryCounts = Field(default_factory=RetryCounts)
     last_modified: Optional[str] = None  # ISO timestamp for sorting pending meetings
     
     # Legacy Fields (Deprecated - for backward compatibility during migration)
@@ -99,3 +104,8 @@ class MeetingState(BaseModel):
     commitments: List[Commitment] = Field(default_factory=list)
     validation: ValidationResult = Field(default_factory=ValidationResult)
 
+
+
+# Warm up validation and serialization once at import time, so the first webhook/Slack
+# request doesn't pay for pydantic-core's lazy first-use setup on the nested models
+MeetingState.model_validate({"meeting_id": "_warmup"}).model_dump()
@@ -0,0 +1,48 @@
+"""
+ARQ Worker
+
+Runs meeting ingestion (Fireflies fetch → Council pipeline → Slack) outside the
+web process so webhooks return immediately.
+
+Start with:
+    arq app.worker.WorkerSettings
+"""
+
+import logging
+from arq.connections import RedisSettings
+from app.config import settings
+from app.ingestion.webhook import process_meeting_task
+from app.services.clients import close_http_clients
+from app.services.storage import db
+
+logger = logging.getLogger(__name__)
+
+
+async def startup(ctx):
+    """Per-worker setup, mirroring the API lifespan (the worker never runs it)."""
+    logging.basicConfig(level=logging.INFO)
+    await db.ensure_indexes()
+    await db.ensure_bloom_filter()
+    logger.info("👷 ARQ worker ready")
+
+
+async def shutdown(ctx):
+    """Flushes buffered audit writes and closes every pooled client."""
+    await close_http_clients()
+    await db.refinement_audit.aclose()
+    await db.close()
+    logger.info("🗄️ MongoDB client closed")
+
+
+async def process_meeting(ctx, meeting_id: str):
+    """Queue entry point for a single meeting."""
+    await process_meeting_task(meeting_id)
+
+
+class WorkerSettings:
+    functions = [process_meeting]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL) if settings.REDIS_URL else RedisSettings()
+    job_timeout = 1800  # Council debate loops + LLM calls can take several minutes
+    max_tries = 1       # process_meeting_task records its own failures via mark_failed
@@ -16,7 +16,8 @@ async def inspect_latest():
     print("="*80 + "\n")
     
     try:
-        meeting = await db.get_latest_meeting()
+        # Metadata only; the transcript preview is streamed separately below
+        meeting = await db.get_latest_meeting(projection={"meeting_id": 1, "metadata": 1})
         
         if not meeting:
             print("❌ No meetings found in database.")
@@ -33,8 +34,10 @@ async def inspect_latest():
         print("📜 TRANSCRIPT PREVIEW (First 20 lines):")
         print("-"*40)
         
-        for i, segment in enumerate(meeting.transcript[:20]):
-            print(f"[{i+1}] {segment.speaker}: {segment.text[:100]}...")
+        i = 0
+        async for segment in db.iter_transcript(meeting.meeting_id, limit=20):
+            i += 1
+            print(f"[{i}] {segment.speaker}: {segment.text[:100]}...")
             
         print("\n" + "="*80)
         print("✅ DONE")
@@ -0,0 +1,87 @@
+"""
+Pickled snapshots of parsed transcript fixtures.
+The first load parses + validates the JSON as usual and pickles the resulting MeetingState
+under tests/.cache/, keyed by the SHA-256 of the source file and of app/state.py;
+later runs just unpickle it. Editing the fixture or the state models changes the key,
+so stale snapshots (or pickles of classes that no longer match) are never used.
+Fixtures over STREAM_THRESHOLD_BYTES are parsed incrementally with ijson instead of
+being read into memory whole.
+"""
+
+import hashlib
+import pickle
+from pathlib import Path
+
+import ijson
+import orjson
+from pydantic import TypeAdapter
+import app.state
+from app.state import MeetingState, MeetingMetadata, TranscriptSegment
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+STATIC_TRANSCRIPT = "tests/static_transcript.json"
+COUNCIL_THREAD_ID = "test_council_001"
+
+STREAM_THRESHOLD_BYTES = 1_000_000
+
+# Validates the whole segment list in one pydantic-core call
+_SEG_ADAPTER = TypeAdapter(list[TranscriptSegment])
+
+# Fingerprint of the model definitions the snapshots are pickled from
+_SCHEMA_DIGEST = hashlib.sha256(Path(app.state.__file__).read_bytes()).digest()
+
+
+def _parse_state(path: Path) -> MeetingState:
+    if path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        return _stream_state(path)
+    raw_data = orjson.loads(path.read_bytes())
+    return MeetingState(
+        meeting_id=raw_data["meeting_id"],
+        metadata=MeetingMetadata.model_validate(raw_data["metadata"]),
+        transcript=_SEG_ADAPTER.validate_python(raw_data["transcript"])
+    )
+
+
+def _stream_state(path: Path) -> MeetingState:
+    """Builds the state from a large fixture, validating segments as they are parsed."""
+    with path.open("rb") as f:
+        meeting_id = next(ijson.items(f, "meeting_id"))
+    with path.open("rb") as f:
+        metadata = next(ijson.items(f, "metadata", use_float=True))
+    with path.open("rb") as f:
+        transcript = [
+            TranscriptSegment.model_validate(s)
+            for s in ijson.items(f, "transcript.item", use_float=True)
+        ]
+    return MeetingState(
+        meeting_id=meeting_id,
+        metadata=MeetingMetadata.model_validate(metadata),
+        transcript=transcript
+    )
+
+
+def load_state(path: str) -> MeetingState:
+    """Loads a static transcript fixture as a MeetingState, via the pickle cache."""
+    path = Path(path)
+    with path.open("rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    digest.update(_SCHEMA_DIGEST)
+    digest = digest.hexdigest()
+    snapshot = CACHE_DIR / f"{digest[:16]}.pkl"
+
+    if snapshot.exists():
+        with snapshot.open("rb") as f:
+            return pickle.load(f)
+
+    state = _parse_state(path)
+    CACHE_DIR.mkdir(exist_ok=True)
+    with snapshot.open("wb") as f:
+        pickle.dump(state, f, protocol=5)
+    return state
+
+
+async def run_to_review(path: str, thread_id: str) -> MeetingState:
+    """Runs the Council pipeline on a static fixture until it pauses at human review."""
+    from app.graph.workflow_council import run_council_pipeline
+    return await run_council_pipeline(load_state(path), thread_id=thread_id)
@@ -0,0 +1,13 @@
+"""
+Console output helpers shared by the script-style tests.
+"""
+
+import sys
+
+RULE80 = "=" * 80
+
+
+def banner(lines):
+    """Emits one phase's output as a single buffered write instead of a print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures.
+The Council pipeline (several LLM calls) runs once per session; tests request
+`council_state`, a private deep copy of that paused state, so one test's mutations
+(e.g. saving it under another meeting_id) can't leak into the next.
+Tests skip when the fixture or credentials are missing.
+"""
+
+import os
+
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from tests._fixture_cache import STATIC_TRANSCRIPT, COUNCIL_THREAD_ID, run_to_review
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def paused_council_state():
+    if not os.path.exists(STATIC_TRANSCRIPT):
+        pytest.skip(f"{STATIC_TRANSCRIPT} not found")
+    if not settings.GEMINI_API_KEY or not settings.MONGODB_URI:
+        pytest.skip("GEMINI_API_KEY and MONGODB_URI are required to run the Council pipeline")
+    return await run_to_review(STATIC_TRANSCRIPT, COUNCIL_THREAD_ID)
+
+
+@pytest.fixture
+def council_state(paused_council_state):
+    return paused_council_state.model_copy(deep=True)
@@ -6,15 +6,19 @@ Fetches transcript from Fireflies API and sends output to Slack channel.
 import asyncio
 import sys
 import logging
-from app.graph.workflow_council import run_council_pipeline
-from app.services.storage import db
-from app.services.slack import slack_service
-from app.services.fireflies import fireflies_client
+from tests._output import RULE80, banner
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Banner string, built once at import
+_BANNER = (
+    "╔" + "═"*78 + "╗\n"
+    "║" + " "*15 + "END-TO-END COUNCIL PIPELINE TEST" + " "*31 + "║\n"
+    "╚" + "═"*78 + "╝"
+)
+
 # ============================================================
 # CONFIGURATION: Set your Fireflies Meeting ID here
 # ============================================================
@@ -26,90 +30,93 @@ async def test_with_slack(meeting_id: str):
     Full pipeline test with Slack integration:
     1. Fetch transcript from Fireflies API
     2. Run Council pipeline (will pause at human_review)
-    3. Save to MongoDB with status="pending"
-    4. Send draft to Slack channel
+    3. Save to MongoDB with status="active_review"
+    4. Send draft to Slack channel (concurrently with 3)
     5. Wait for user DM (via running server)
     """
-    
-    print("\n" + "="*80)
-    print("🏛️ COUNCIL PIPELINE - END-TO-END TEST WITH SLACK")
-    print("="*80 + "\n")
+    # Imported here so importing this module stays cheap: the graph, Mongo, Slack and
+    # Fireflies clients only load once the test actually runs
+    from app.graph.workflow_council import run_council_pipeline
+    from app.services.storage import get_db
+    from app.services.slack import slack_service
+    from app.services.fireflies import fireflies_client
+    db = get_db()
+    
+    banner([
+        "\n" + RULE80,
+        "🏛️ COUNCIL PIPELINE - END-TO-END TEST WITH SLACK",
+        RULE80 + "\n",
+    ])
     
     # Auto-approve any abandoned active_review meetings from previous runs
     approved_count = await db.auto_approve_active_reviews()
     if approved_count > 0:
-        print(f"🔄 Auto-approved {approved_count} abandoned meeting(s) from previous session\n")
+        banner([f"🔄 Auto-approved {approved_count} abandoned meeting(s) from previous session\n"])
     
     # 1. Fetch transcript from Fireflies API
-    print(f"🔥 Fetching transcript from Fireflies API...")
-    print(f"   Meeting ID: {meeting_id}")
+    banner([
+        "🔥 Fetching transcript from Fireflies API...",
+        f"   Meeting ID: {meeting_id}",
+    ])
     
     try:
-        initial_state = fireflies_client.get_transcript(meeting_id)
+        initial_state = await fireflies_client.get_transcript(meeting_id)
     except Exception as e:
-        print(f"\n❌ Failed to fetch transcript from Fireflies API: {e}")
-        print("   Check your FIREFLIES_API_KEY and Meeting ID")
+        banner([
+            f"\n❌ Failed to fetch transcript from Fireflies API: {e}",
+            "   Check your FIREFLIES_API_KEY and Meeting ID",
+        ])
         return
     
-    print(f"✅ Loaded: {initial_state.metadata.title}")
-    print(f"   Meeting ID: {initial_state.meeting_id}")
-    print(f"   Transcript segments: {len(initial_state.transcript)}\n")
-    
     # 2. Run Council Pipeline
-    print("="*80)
-    print("🚀 RUNNING COUNCIL PIPELINE")
-    print("="*80 + "\n")
+    banner([
+        f"✅ Loaded: {initial_state.metadata.title}",
+        f"   Meeting ID: {initial_state.meeting_id}",
+        f"   Transcript segments: {len(initial_state.transcript)}\n",
+        RULE80,
+        "🚀 RUNNING COUNCIL PIPELINE",
+        RULE80 + "\n",
+    ])
     
     final_state = await run_council_pipeline(
         initial_state, 
         thread_id=initial_state.meeting_id
     )
     
-    print("\n" + "="*80)
-    print("⏸️ PIPELINE PAUSED AT HUMAN REVIEW CHECKPOINT")
-    print("="*80 + "\n")
-    
-    # 3. Save to MongoDB
-    print("💾 Saving state to MongoDB...")
-    await db.save_meeting(final_state)
-    print(f"✅ Saved with human_feedback.status = '{final_state.human_feedback.status}'")
-    
-    # CRITICAL: Activate this meeting for feedback loop
-    final_state.human_feedback.status = "active_review"
-    await db.save_meeting(final_state)
-    print(f"🔄 Activated for review (status = 'active_review')\n")
-    
-    # 4. Display what will be sent to Slack
-    print("="*80)
-    print("📊 COUNCIL OUTPUT SUMMARY")
-    print("="*80 + "\n")
-    
-    print(f"🎯 Strategist: {final_state.strategist.meeting_type} / {final_state.strategist.tone}")
-    print(f"📊 Extractor: {len(final_state.extractor.commitments)} commitments, {len(final_state.extractor.decisions)} decisions")
-    print(f"⚖️ Critic: Both approved = {final_state.critic.strategist_approved and final_state.critic.extractor_approved}")
-    print(f"📧 Email Subject: {final_state.email.subject}\n")
-    
-    # 5. Send to Slack (if in active review mode)
-    if final_state.human_feedback.status == "active_review":
-        print("="*80)
-        print("📢 SENDING TO SLACK CHANNEL")
-        print("="*80 + "\n")
-        
+    # 3 + 4. Save to MongoDB and send to Slack concurrently (the Slack message doesn't read the DB)
+    # CRITICAL: Activate this meeting for feedback loop in the same (single) save
+    banner([
+        "\n" + RULE80,
+        "⏸️ PIPELINE PAUSED AT HUMAN REVIEW CHECKPOINT",
+        RULE80 + "\n",
+        "💾 Saving state to MongoDB and 📢 sending draft to Slack channel...",
+    ])
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(db.save_and_activate(final_state))
         # Send notification (no channel_id = uses webhook)
-        slack_service.send_notification(final_state)
-        
-        print("✅ Draft sent to Slack!\n")
-        print("="*80)
-        print("👤 NEXT STEPS FOR YOU:")
-        print("="*80)
-        print("1. Check your Slack channel - you should see the draft")
-        print("2. Start the server: uvicorn app.main:app --reload")
-        print("3. DM the Cube Bot with feedback, e.g.:")
-        print("   'Add a task for Bob to review the budget by Monday'")
-        print("4. The bot will resume the pipeline and send updated draft")
-        print("="*80 + "\n")
-    else:
-        print("⚠️ Pipeline completed without pause (unexpected)\n")
+        tg.create_task(slack_service.send_notification(final_state))
+    
+    # 5. Display what was sent to Slack
+    banner([
+        f"✅ Saved and activated for review (status = '{final_state.human_feedback.status}')",
+        "✅ Draft sent to Slack!\n",
+        RULE80,
+        "📊 COUNCIL OUTPUT SUMMARY",
+        RULE80 + "\n",
+        f"🎯 Strategist: {final_state.strategist.meeting_type} / {final_state.strategist.tone}",
+        f"📊 Extractor: {len(final_state.extractor.commitments)} commitments, {len(final_state.extractor.decisions)} decisions",
+        f"⚖️ Critic: Both approved = {final_state.critic.strategist_approved and final_state.critic.extractor_approved}",
+        f"📧 Email Subject: {final_state.email.subject}\n",
+        RULE80,
+        "👤 NEXT STEPS FOR YOU:",
+        RULE80,
+        "1. Check your Slack channel - you should see the draft",
+        "2. Start the server: uvicorn app.main:app --reload",
+        "3. DM the Cube Bot with feedback, e.g.:",
+        "   'Add a task for Bob to review the budget by Monday'",
+        "4. The bot will resume the pipeline and send updated draft",
+        RULE80 + "\n",
+    ])
 
 if __name__ == "__main__":
     # Allow passing meeting ID via command line
@@ -121,9 +128,7 @@ if __name__ == "__main__":
         print(f"   Usage: python tests/test_council_slack.py <MEETING_ID>\n")
     
     print("\n")
-    print("╔" + "═"*78 + "╗")
-    print("║" + " "*15 + "END-TO-END COUNCIL PIPELINE TEST" + " "*31 + "║")
-    print("╚" + "═"*78 + "╝")
+    print(_BANNER)
     print("\n")
     
     asyncio.run(test_with_slack(meeting_id))
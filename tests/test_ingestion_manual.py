@@ -1,7 +1,11 @@
-import requests
+import httpx
+import hmac
+import orjson
 import time
 import sys
 import asyncio
+from pymongo.errors import OperationFailure
+from app.config import settings
 from app.services.storage import db
 from app.services.fireflies import fireflies_client
 
@@ -10,7 +14,7 @@ from app.services.fireflies import fireflies_client
 async def test_direct_api(meeting_id):
     print(f"\n--- STEP 1: Testing Fireflies API Direct Fetch for {meeting_id} ---")
     try:
-        meeting_state = fireflies_client.get_transcript(meeting_id)
+        meeting_state = await fireflies_client.get_transcript(meeting_id)
         print("✅ Success! Fireflies API returned valid transcript.")
         print(f"Title: {meeting_state.metadata.title}")
         print(f"Participants: {meeting_state.metadata.participants}")
@@ -23,16 +27,22 @@ async def test_direct_api(meeting_id):
         print("Check your FIREFLIES_API_KEY and Meeting ID.")
         return False
 
-def trigger_webhook(meeting_id):
+async def trigger_webhook(meeting_id):
     print(f"\n--- STEP 2: Triggering Webhook to Local Server ---")
     url = "http://localhost:8000/webhook/fireflies"
     payload = {
         "event": "meeting.completed",
         "meeting_id": meeting_id
     }
+    # Sign the exact bytes we send, like Fireflies does, so verification passes when a secret is set
+    body = orjson.dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    if settings.FIREFLIES_WEBHOOK_SECRET:
+        headers["x-hub-signature"] = hmac.digest(settings.FIREFLIES_WEBHOOK_SECRET.encode(), body, "sha256").hex()
     try:
         print(f"Sending POST to {url}...")
-        resp = requests.post(url, json=payload)
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            resp = await client.post(url, content=body, headers=headers)
         resp.raise_for_status()
         print(f"✅ Webhook accepted by server. Response: {resp.json()}")
     except Exception as e:
@@ -40,16 +50,25 @@ def trigger_webhook(meeting_id):
         print("Is the server running? (uvicorn app.main:app --reload)")
         sys.exit(1)
 
-async def check_db(meeting_id):
-    print(f"\n--- STEP 3: Verifying MongoDB Persistence ---")
-    print(f"Polling DB for meeting_id: {meeting_id}...")
+async def _report_found(meeting_id):
+    meeting = await db.get_meeting(meeting_id)
+    print("\n✅ SUCCESS: Meeting found in MongoDB!")
+    print(f"Title: {meeting.metadata.title}")
+    print(f"Stored Segments: {len(meeting.transcript)}")
+
+async def _print_dots():
+    while True:
+        await asyncio.sleep(1)
+        sys.stdout.write(".")
+        sys.stdout.flush()
+
+async def _poll_db(meeting_id):
+    # Fallback when change streams aren't available (standalone mongod)
     max_retries = 15
     for i in range(max_retries):
         meeting = await db.get_meeting(meeting_id)
         if meeting:
-            print("\n✅ SUCCESS: Meeting found in MongoDB!")
-            print(f"Title: {meeting.metadata.title}")
-            print(f"Stored Segments: {len(meeting.transcript)}")
+            await _report_found(meeting_id)
             return
         
         sys.stdout.write(".")
@@ -59,15 +78,42 @@ async def check_db(meeting_id):
     print("\n\n❌ TIMEOUT: Meeting not found in DB after 30 seconds.")
     print("Check your server terminal for error logs (likely in background task).")
 
+async def check_db(meeting_id):
+    print(f"\n--- STEP 3: Verifying MongoDB Persistence ---")
+    print(f"Waiting for meeting_id in DB: {meeting_id}...")
+    pipeline = [{"$match": {
+        "operationType": {"$in": ["insert", "replace"]},
+        "fullDocument.meeting_id": meeting_id
+    }}]
+    try:
+        # Open the stream before checking, so an insert in between isn't missed
+        async with db.meetings.watch(pipeline, max_await_time_ms=30000) as stream:
+            if not await db.meeting_exists(meeting_id):
+                dots = asyncio.create_task(_print_dots())
+                try:
+                    await asyncio.wait_for(stream.next(), timeout=30)
+                except asyncio.TimeoutError:
+                    print("\n\n❌ TIMEOUT: Meeting not found in DB after 30 seconds.")
+                    print("Check your server terminal for error logs (likely in background task).")
+                    return
+                finally:
+                    dots.cancel()
+    except OperationFailure:
+        # Change streams require a replica set
+        await _poll_db(meeting_id)
+        return
+    await _report_found(meeting_id)
+
 async def main(m_id):
-    # 1. Direct API Test (Client-side verify)
-    success = await test_direct_api(m_id)
+    # 1 + 2. Direct API Test (Client-side verify) and Webhook trigger are independent,
+    # so overlap them on the event loop
+    success, _ = await asyncio.gather(
+        test_direct_api(m_id),
+        trigger_webhook(m_id)
+    )
     if not success:
-        print("Aborting webhook test since API fetch failed.")
+        print("Skipping DB check since API fetch failed.")
         return
-
-    # 2. Trigger Webhook
-    trigger_webhook(m_id)
     
     # 3. Check DB
     await check_db(m_id)
@@ -21,7 +21,7 @@ async def test_resume_simulation():
     # 1. Find a meeting in 'active_review' or 'pending' state
     # We use the meeting we just created in the previous test
     print("🔍 Looking for a suitable meeting to resume...")
-    meeting_state = await db.get_pending_meeting()
+    meeting_state = await db.claim_pending_meeting()
     
     if not meeting_state:
         print("❌ No meeting found! Please run `test_council_slack.py` first to generate a pending meeting.")
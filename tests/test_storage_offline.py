@@ -0,0 +1,285 @@
+"""
+Offline unit tests for the StorageService Bloom filter state machine and AuditBuffer.
+Redis and MongoDB are replaced by small in-memory fakes; no server is needed.
+"""
+
+import asyncio
+
+import pytest
+from redis.exceptions import ResponseError
+
+from app.services.storage import AuditBuffer, StorageService, BLOOM_KEY, BLOOM_STALE_KEY
+
+
+# ============================================================
+# FAKES
+# ============================================================
+
+class FakeRedis:
+    """Just enough of redis.asyncio + RedisBloom for the dedup paths (a filter is a set)."""
+
+    def __init__(self, bloom_module: bool = True):
+        self.keys = {}
+        self.down = False
+        self.bloom_module = bloom_module
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("redis down")
+
+    async def exists(self, key):
+        self._check()
+        return int(key in self.keys)
+
+    async def delete(self, key):
+        self._check()
+        return int(self.keys.pop(key, None) is not None)
+
+    async def set(self, key, value, nx=False, ex=None):
+        self._check()
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value
+        return True
+
+    async def execute_command(self, *args):
+        self._check()
+        return self._command(*args)
+
+    def _command(self, name, key, *args):
+        if not self.bloom_module:
+            raise ResponseError(f"unknown command '{name}'")
+        if name == "BF.RESERVE":
+            if key in self.keys:
+                raise ResponseError("ERR item exists")
+            self.keys[key] = set()
+            return True
+        if name == "BF.INSERT":
+            assert args[:2] == ("NOCREATE", "ITEMS")
+            if key not in self.keys:
+                raise ResponseError("ERR not found")
+            self.keys[key].update(args[2:])
+            return [1] * (len(args) - 2)
+        if name == "BF.EXISTS":
+            return int(args[0] in self.keys.get(key, ()))
+        raise AssertionError(f"unexpected command {name}")
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def execute_command(self, *args):
+        self.commands.append(lambda: self.redis._command(*args))
+
+    def exists(self, key):
+        self.commands.append(lambda: int(key in self.redis.keys))
+
+    async def execute(self):
+        self.redis._check()
+        return [command() for command in self.commands]
+
+
+class FakeMeetings:
+    """meetings collection holding only meeting_ids; counts the existence lookups."""
+
+    def __init__(self, meeting_ids, on_find=None):
+        self.meeting_ids = list(meeting_ids)
+        self.find_one_calls = 0
+        self.on_find = on_find
+
+    async def _iter(self):
+        for meeting_id in self.meeting_ids:
+            if self.on_find:
+                self.on_find()
+            yield {"meeting_id": meeting_id}
+
+    def find(self, filter, projection=None):
+        return self._iter()
+
+    async def find_one(self, filter, projection=None):
+        self.find_one_calls += 1
+        meeting_id = filter["meeting_id"]
+        return {"meeting_id": meeting_id} if meeting_id in self.meeting_ids else None
+
+
+class FakeAuditCollection:
+    def __init__(self, fail_first: bool = False):
+        self.batches = []
+        self.fail_first = fail_first
+
+    async def insert_many(self, batch, ordered=True):
+        if self.fail_first:
+            self.fail_first = False
+            raise RuntimeError("write failed")
+        self.batches.append(list(batch))
+
+
+def make_service(redis, meeting_ids, on_find=None) -> StorageService:
+    service = StorageService()
+    service.redis = redis
+    service.meetings = FakeMeetings(meeting_ids, on_find)
+    return service
+
+
+# ============================================================
+# BLOOM FILTER
+# ============================================================
+
+@pytest.mark.asyncio
+async def test_new_filter_is_backfilled_and_trusted():
+    redis = FakeRedis()
+    service = make_service(redis, ["a", "b"])
+
+    await service.ensure_bloom_filter()
+
+    assert service.bloom_enabled
+    assert redis.keys[BLOOM_KEY] == {"a", "b"}
+    assert BLOOM_STALE_KEY not in redis.keys
+    assert await service.meeting_exists("new") is False
+    assert service.meetings.find_one_calls == 0  # Miss answered by the filter alone
+    assert await service.meeting_exists("a") is True
+
+
+@pytest.mark.asyncio
+async def test_stale_marker_covers_backfill_window():
+    redis = FakeRedis()
+    seen_stale = []
+    service = make_service(redis, ["a", "b"], on_find=lambda: seen_stale.append(BLOOM_STALE_KEY in redis.keys))
+
+    await service.ensure_bloom_filter()
+
+    assert seen_stale == [True, True]
+    assert BLOOM_STALE_KEY not in redis.keys
+
+
+@pytest.mark.asyncio
+async def test_existing_filter_is_reused():
+    redis = FakeRedis()
+    redis.keys[BLOOM_KEY] = {"a"}
+    service = make_service(redis, ["a", "b"])
+
+    await service.ensure_bloom_filter()
+
+    assert service.bloom_enabled
+    assert redis.keys[BLOOM_KEY] == {"a"}  # No rebuild
+
+
+@pytest.mark.asyncio
+async def test_stale_filter_is_rebuilt():
+    redis = FakeRedis()
+    redis.keys[BLOOM_KEY] = {"old"}
+    redis.keys[BLOOM_STALE_KEY] = "1"
+    service = make_service(redis, ["a", "b"])
+
+    await service.ensure_bloom_filter()
+
+    assert redis.keys[BLOOM_KEY] == {"a", "b"}
+    assert BLOOM_STALE_KEY not in redis.keys
+
+
+@pytest.mark.asyncio
+async def test_miss_not_trusted_while_stale():
+    redis = FakeRedis()
+    service = make_service(redis, ["a"])
+    await service.ensure_bloom_filter()
+
+    service.meetings.meeting_ids.append("b")  # Stored by a writer whose add was lost
+    redis.keys[BLOOM_STALE_KEY] = "1"
+
+    assert await service.meeting_exists("b") is True
+    assert service.meetings.find_one_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_filter_falls_back_and_add_marks_stale():
+    redis = FakeRedis()
+    service = make_service(redis, ["a"])
+    await service.ensure_bloom_filter()
+
+    del redis.keys[BLOOM_KEY]  # Redis restarted / key evicted
+    assert await service.meeting_exists("a") is True
+    assert service.meetings.find_one_calls == 1
+
+    await service._remember_meeting("c")
+    assert BLOOM_KEY not in redis.keys  # NOCREATE: no empty filter recreated
+    assert redis.keys[BLOOM_STALE_KEY] == "1"
+
+
+@pytest.mark.asyncio
+async def test_unreported_stale_marker_is_retried():
+    redis = FakeRedis()
+    service = make_service(redis, ["a"])
+    await service.ensure_bloom_filter()
+
+    redis.down = True
+    await service._remember_meeting("c")
+    assert service._bloom_stale_unreported
+
+    redis.down = False
+    assert await service.meeting_exists("unknown") is False
+    assert service.meetings.find_one_calls == 1  # Answered by MongoDB, not the filter
+    assert redis.keys[BLOOM_STALE_KEY] == "1"
+    assert not service._bloom_stale_unreported
+
+
+@pytest.mark.asyncio
+async def test_without_redisbloom_every_lookup_uses_mongodb():
+    redis = FakeRedis(bloom_module=False)
+    service = make_service(redis, ["a"])
+
+    await service.ensure_bloom_filter()
+
+    assert not service.bloom_enabled
+    assert await service.meeting_exists("unknown") is False
+    assert service.meetings.find_one_calls == 1
+
+
+# ============================================================
+# AUDIT BUFFER
+# ============================================================
+
+@pytest.mark.asyncio
+async def test_audit_buffer_batches_documents():
+    collection = FakeAuditCollection()
+    buffer = AuditBuffer(collection, max_batch=3, flush_interval=0.01)
+
+    for i in range(7):
+        buffer.push({"n": i})
+    await asyncio.sleep(0.1)
+
+    assert [len(batch) for batch in collection.batches] == [3, 3, 1]
+    await buffer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_audit_buffer_aclose_flushes_partial_batch():
+    collection = FakeAuditCollection()
+    buffer = AuditBuffer(collection, max_batch=10, flush_interval=60)
+    docs = [{"n": i} for i in range(5)]
+
+    for doc in docs:
+        buffer.push(doc)
+    await asyncio.sleep(0)  # Flush task picks up the documents and waits for more
+
+    await buffer.aclose()
+
+    assert collection.batches == [docs]
+
+
+@pytest.mark.asyncio
+async def test_audit_buffer_survives_failed_flush():
+    collection = FakeAuditCollection(fail_first=True)
+    buffer = AuditBuffer(collection, max_batch=1, flush_interval=0.01)
+
+    buffer.push({"n": 0})
+    await asyncio.sleep(0.05)
+    buffer.push({"n": 1})
+    await asyncio.sleep(0.05)
+
+    assert collection.batches == [[{"n": 1}]]
+    await buffer.aclose()
@@ -0,0 +1,51 @@
+"""
+Unit tests for verify_fireflies_signature (no server, network or database needed).
+"""
+
+import hmac
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.ingestion import webhook
+
+SECRET = b"test-secret"
+BODY = b'{"meetingId": "abc123", "eventType": "Transcription completed"}'
+SIGNATURE = hmac.digest(SECRET, BODY, "sha256").hex()
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(monkeypatch):
+    monkeypatch.setattr(webhook, "_WEBHOOK_KEY", SECRET)
+
+
+def _request(headers: dict):
+    # verify_fireflies_signature only reads request.headers
+    return SimpleNamespace(headers=headers)
+
+
+def test_accepts_bare_hex_signature():
+    webhook.verify_fireflies_signature(_request({"x-hub-signature": SIGNATURE}), BODY)
+
+
+def test_accepts_prefixed_signature():
+    webhook.verify_fireflies_signature(_request({"x-hub-signature": f"sha256={SIGNATURE}"}), BODY)
+
+
+def test_rejects_missing_header():
+    with pytest.raises(HTTPException) as exc:
+        webhook.verify_fireflies_signature(_request({}), BODY)
+    assert exc.value.status_code == 400
+
+
+def test_rejects_bad_signature():
+    with pytest.raises(HTTPException) as exc:
+        webhook.verify_fireflies_signature(_request({"x-hub-signature": "0" * 64}), BODY)
+    assert exc.value.status_code == 403
+
+
+def test_rejects_signature_of_other_body():
+    with pytest.raises(HTTPException) as exc:
+        webhook.verify_fireflies_signature(_request({"x-hub-signature": SIGNATURE}), BODY + b" ")
+    assert exc.value.status_code == 403